@@ -0,0 +1,134 @@
+import numpy as np
+import pandas as pd
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class ArrayTableModel(QAbstractTableModel):
+    """
+    컬럼 배열 기반 테이블 모델.
+
+    셀 문자열은 뷰가 요청할 때만 만들고, 정렬·필터는 행 인덱스 배열(np.argsort, 벡터 문자열 검색)로
+    처리하므로 수만 행에서도 스크롤이 가볍습니다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._headers, self._columns, self._formats = [], [], {}
+        self._rows = np.arange(0)
+        self._sort_column, self._sort_order = None, Qt.AscendingOrder
+        self._filter_text = ""
+        self._text_cache = {}
+
+    def set_columns(self, columns, formats=None):
+        """
+        표시할 데이터를 설정합니다.
+
+        Args:
+            columns (dict): 헤더 -> 값 배열 (모든 배열 길이 동일).
+            formats (dict): 헤더 -> 포맷 문자열 (예: "{:,.0f}").
+        """
+        self.beginResetModel()
+        self._headers = list(columns)
+        self._columns = [np.asarray(values) for values in columns.values()]
+        self._formats = formats or {}
+        self._text_cache = {}
+        self._apply()
+        self.endResetModel()
+
+    def set_filter(self, text):
+        """문자열 컬럼 중 하나라도 text를 포함하는 행만 표시 (대소문자 무시)"""
+        self.beginResetModel()
+        self._filter_text = text.strip().lower()
+        self._apply()
+        self.endResetModel()
+
+    def _num_rows(self):
+        return len(self._columns[0]) if self._columns else 0
+
+    def _text(self, col):
+        """문자열 컬럼의 소문자 고정 길이 배열 (필터·정렬용, 최초 사용 시 생성, 결측은 빈 문자열)"""
+        if col not in self._text_cache:
+            values = self._columns[col]
+            text = values.astype(str)
+            if values.dtype == object:
+                text[pd.isna(values)] = ""
+            self._text_cache[col] = np.char.lower(text)
+        return self._text_cache[col]
+
+    def _missing(self, col, rows):
+        """rows 행 중 빈 칸(NaN, NaT, 결측 문자열)인 행"""
+        values = self._columns[col]
+        if values.dtype.kind in "OUS":
+            return self._text(col)[rows] == ""
+        if values.dtype.kind in "fM":
+            return np.isnan(values[rows]) if values.dtype.kind == "f" else np.isnat(values[rows])
+        return np.zeros(len(rows), dtype=bool)
+
+    def _apply(self):
+        rows = np.arange(self._num_rows())
+
+        if self._filter_text:
+            mask = np.zeros(len(rows), dtype=bool)
+            for col, values in enumerate(self._columns):
+                if values.dtype.kind in "OUS":
+                    mask |= np.char.find(self._text(col), self._filter_text) >= 0
+            rows = rows[mask]
+
+        if self._sort_column is not None and 0 <= self._sort_column < len(self._columns):
+            values = self._columns[self._sort_column]
+            keys = (self._text(self._sort_column) if values.dtype.kind in "OUS" else values)[rows]
+            order = np.argsort(keys, kind="stable")
+            # 값이 있는 행만 정렬 방향을 적용하고 빈 칸은 항상 마지막에 표시
+            missing = self._missing(self._sort_column, rows)[order]
+            present = order[~missing]
+            if self._sort_order == Qt.DescendingOrder:
+                present = present[::-1]
+            rows = rows[np.concatenate([present, order[missing]])]
+
+        self._rows = rows
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        values = self._columns[index.column()]
+        if role == Qt.DisplayRole:
+            return self._format(index.column(), values[self._rows[index.row()]])
+        if role == Qt.TextAlignmentRole and values.dtype.kind in "iuf":
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def _format(self, col, value):
+        kind = self._columns[col].dtype.kind
+        if (kind == "f" and np.isnan(value)) or (kind == "M" and np.isnat(value)):
+            return ""
+        if kind == "O" and pd.api.types.is_scalar(value) and pd.isna(value):
+            return ""
+        if kind == "M":
+            return str(value)[:10]
+        fmt = self._formats.get(self._headers[col])
+        if fmt:
+            return fmt.format(value)
+        if kind == "f":
+            return f"{value:,.2f}"
+        if kind in "iu":
+            return f"{value:,}"
+        return str(value)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section]
+        return str(section + 1)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.beginResetModel()
+        self._sort_column, self._sort_order = column, order
+        self._apply()
+        self.endResetModel()
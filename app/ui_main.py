@@ -1,14 +1,29 @@
+import os
 import sys
 import sqlite3
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QLabel, QDateEdit, QPushButton,
-    QVBoxLayout, QWidget, QComboBox, QTableWidget, QTableWidgetItem
+    QVBoxLayout, QWidget, QComboBox, QTableView, QHeaderView, QLineEdit
 )
+from PyQt5.QtCore import Qt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
 from matplotlib.figure import Figure
 from datetime import datetime, timedelta
 import pandas as pd
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from krxquant.panel import from_panel
+from krxquant.service import connect_service
+from table_model import ArrayTableModel
+
+# 결과 보기별 표시 컬럼
+RESULT_VIEWS = {
+    "Holdings by Rebalance Date": ["Date", "Ticker", "Name", "Close", "PER", "Weight", "ChangeRate"],
+    "Screened Universe": ["Date", "Ticker", "Name", "Close", "PER", "PBR", "DIV", "ChangeRate"],
+}
+RESULT_FORMATS = {"Close": "{:,.0f}", "Weight": "{:.2%}"}
+
 # 그래프 캔버스
 class MplCanvas(FigureCanvasQTAgg):
     def __init__(self, parent=None, width=5, height=4, dpi=100):
@@ -58,52 +73,90 @@ class BacktestApp(QMainWindow):
         self.run_button.clicked.connect(self.run_backtest)
         self.layout.addWidget(self.run_button)
 
-        # 결과 테이블
-        self.result_table = QTableWidget()
-        self.result_table.setRowCount(10)
-        self.result_table.setColumnCount(4)
-        self.result_table.setHorizontalHeaderLabels(["Ticker", "Name", "Close", "PER"])
+        # 결과 보기 선택 및 필터
+        self.view_combo = QComboBox()
+        self.view_combo.addItems(list(RESULT_VIEWS))
+        self.view_combo.currentTextChanged.connect(self.show_results)
+        self.layout.addWidget(self.view_combo)
+
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("Filter by Ticker / Name")
+        self.layout.addWidget(self.filter_input)
+
+        # 결과 테이블 (배열 기반 모델, 셀은 화면에 보일 때만 생성)
+        self.result_model = ArrayTableModel(self)
+        self.filter_input.textChanged.connect(self.result_model.set_filter)
+        self.result_table = QTableView()
+        self.result_table.setModel(self.result_model)
+        self.result_table.setSortingEnabled(True)
+        self.result_table.sortByColumn(0, Qt.AscendingOrder)
+        self.result_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.result_table.verticalHeader().setDefaultSectionSize(22)
         self.layout.addWidget(self.result_table)
 
+        self.holdings = pd.DataFrame()
+        self.universe = pd.DataFrame()
+
         # 그래프
         self.canvas = MplCanvas(self, width=5, height=3)
         self.layout.addWidget(self.canvas)
 
+        # 데이터 서비스(krxquant serve)가 실행 중이면 공유 메모리 패널을 복사 없이 사용
+        self.panel = None
+        client = connect_service()
+        if client is not None:
+            with client:
+                self.panel = client.attach()
+
         # 메인 위젯 설정
         central_widget = QWidget()
         central_widget.setLayout(self.layout)
         self.setCentralWidget(central_widget)
 
-    def run_backtest(self):
-        # 입력값 가져오기
-        strategy = self.strategy_combo.currentText()
-        start_date = self.start_date_input.text()
-        end_date = self.end_date_input.text()
+    def load_data(self, start_date, end_date):
+        """
+        데이터 서비스의 공유 메모리 패널 또는 데이터베이스에서 기간 데이터를 로드합니다.
+
+        두 경로 모두 load_data와 같이 PER이 없는 행을 제외합니다. 단, 서비스 패널에는 서비스를 실행할 때
+        지정한 기간(serve --start/--end)의 데이터만 있으므로 그 밖의 날짜는 서비스 사용 시 결과에 나타나지 않습니다.
+        """
+        if self.panel is not None:
+            return from_panel(self.panel, self.panel.date_range_slice(start_date, end_date)).reset_index()
 
         # 데이터베이스 연결
         db_path = "krx_data.db"
         connection = sqlite3.connect(db_path)
-        cursor = connection.cursor()
 
         # 데이터 쿼리 실행
         query = f"""
         SELECT * FROM stock_monthly_data
-        WHERE Date BETWEEN '{start_date}' AND '{end_date}'
+        WHERE PER IS NOT NULL AND Date BETWEEN '{start_date}' AND '{end_date}'
         ORDER BY Date, Ticker
         """
         try:
-            data = pd.read_sql(query, connection, parse_dates=["Date"])
+            return pd.read_sql(query, connection, parse_dates=["Date"])
+        finally:
+            connection.close()
+
+    def run_backtest(self):
+        # 입력값 가져오기
+        strategy = self.strategy_combo.currentText()
+        start_date = self.start_date_input.text()
+        end_date = self.end_date_input.text()
+
+        try:
+            data = self.load_data(start_date, end_date)
             if data.empty:
                 raise ValueError("No data found for the selected date range.")
 
             # 백테스트 로직
             portfolio_values = []
+            holdings = []
             initial_cash = 10_000_000  # 1000만 원
-            dates = sorted(data["Date"].unique())
+            dates = []
 
-            for date in dates:
-                monthly_data = data[data["Date"] == date]
-                top_stocks = monthly_data.nsmallest(5, "PER")  # Top 5 stocks by PER
+            for date, monthly_data in data.groupby("Date", sort=True):
+                top_stocks = monthly_data.nsmallest(5, "PER").copy()  # Top 5 stocks by PER
                 total_value = top_stocks["Close"].sum()
 
                 # 비중 계산 및 수익률
@@ -111,14 +164,13 @@ class BacktestApp(QMainWindow):
                 portfolio_return = (top_stocks["ChangeRate"] / 100 * top_stocks["Weight"]).sum()
                 initial_cash *= (1 + portfolio_return)
                 portfolio_values.append(initial_cash)
+                dates.append(date)
+                holdings.append(top_stocks)
 
             # 결과 테이블 업데이트
-            self.result_table.setRowCount(len(top_stocks))
-            for i, row in top_stocks.iterrows():
-                self.result_table.setItem(i, 0, QTableWidgetItem(row["Ticker"]))
-                self.result_table.setItem(i, 1, QTableWidgetItem(row["Name"]))
-                self.result_table.setItem(i, 2, QTableWidgetItem(str(row["Close"])))
-                self.result_table.setItem(i, 3, QTableWidgetItem(str(row["PER"])))
+            self.holdings = pd.concat(holdings, ignore_index=True)
+            self.universe = data
+            self.show_results()
 
             # 그래프 업데이트
             self.canvas.axes.clear()
@@ -130,12 +182,14 @@ class BacktestApp(QMainWindow):
             self.canvas.draw()
 
         except Exception as e:
-            self.result_table.setRowCount(0)
-            self.result_table.setColumnCount(1)
-            self.result_table.setHorizontalHeaderLabels(["Error"])
-            self.result_table.setItem(0, 0, QTableWidgetItem(str(e)))
-        finally:
-            connection.close()
+            self.result_model.set_columns({"Error": [str(e)]})
+
+    def show_results(self):
+        """선택된 보기(리밸런싱별 보유 종목 / 전체 스크리닝 유니버스)를 테이블 모델에 설정"""
+        view = self.view_combo.currentText()
+        frame = self.universe if view == "Screened Universe" else self.holdings
+        columns = [col for col in RESULT_VIEWS[view] if col in frame.columns]
+        self.result_model.set_columns({col: frame[col].to_numpy() for col in columns}, RESULT_FORMATS)
 
 # 앱 실행
 if __name__ == "__main__":
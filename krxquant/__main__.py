@@ -0,0 +1,5 @@
+import sys
+
+from krxquant.cli import main
+
+sys.exit(main())
@@ -0,0 +1,304 @@
+import logging
+import pandas as pd
+
+from krxquant.panel import Panel, to_panel
+from krxquant.portfolio import RollingCovariance, optimize_weights
+
+logger = logging.getLogger(__name__)
+
+
+def strategy_filter(data, date):
+    """
+    데이터 유효성을 검사하고 전략 적용 가능한 데이터로 필터링.
+
+    Args:
+        data (pd.DataFrame): 원본 데이터.
+
+    Returns:
+        pd.DataFrame: 유효성 검사를 통과한 데이터.
+    """
+    # 날짜 기준 데이터 필터링
+    filtered = data.loc[data.index == date]
+
+    # 필수 컬럼 존재 여부 확인
+    required_columns = ["Ticker", "PER", "PBR", "EPS", "BPS"]
+    for col in required_columns:
+        if col not in data.columns:
+            raise ValueError(f"Missing required column: {col}")
+
+    # 결측치 처리
+    # missing_ratio = data.isnull().sum() / len(data)
+    # print(missing_ratio)
+    data = data.dropna()
+
+    # 중복 데이터 제거
+    data = data.reset_index().drop_duplicates(subset=["Date", "Ticker"]).set_index("Date")
+
+    # 이상치 필터링 (IQR 방식)
+    for col in ["PER", "PBR"]:
+        q1 = data[col].quantile(0.25)
+        q3 = data[col].quantile(0.75)
+        iqr = q3 - q1
+        data = data[(data[col] >= q1 - 1.5 * iqr) & (data[col] <= q3 + 1.5 * iqr)]
+
+    # 값 범위 필터링
+    data = data[(data["PER"] > 0) & (data["PER"] < 30)]
+    data = data[(data["PBR"] > 0) & (data["PBR"] < 5)]
+
+    # 날짜 정렬
+    data = data.sort_values(by="Date")
+
+    return filtered
+
+def apply_trading_cost(price, num_shares, slippage=0.001, fee_rate=0.001):
+    """슬리피지 및 거래 비용 반영"""
+    executed_price = price * (1 + slippage)
+    trade_amount = executed_price * num_shares
+    transaction_fee = trade_amount * fee_rate
+    total_cost = trade_amount + transaction_fee
+    return executed_price, total_cost
+
+def calculate_drawdown(portfolio_values):
+    """최대 낙폭 계산"""
+    peak, max_drawdown, drawdowns = portfolio_values[0], 0, []
+    for value in portfolio_values:
+        peak = max(peak, value)
+        drawdown = (peak - value) / peak
+        drawdowns.append(drawdown)
+        max_drawdown = max(max_drawdown, drawdown)
+    return max_drawdown, drawdowns
+
+def calculate_monthly_return(previous_value, current_value):
+    """월별 수익률 계산"""
+    return (current_value - previous_value) / previous_value if previous_value > 0 else 0.0
+
+def calculate_cagr(initial_value, final_value, start_date, end_date):
+    """
+    CAGR (연평균 성장률) 계산.
+
+    Args:
+        initial_value (float): 초기 포트폴리오 가치.
+        final_value (float): 최종 포트폴리오 가치.
+        start_date (str): 백테스트 시작 날짜 (YYYY-MM-DD).
+        end_date (str): 백테스트 종료 날짜 (YYYY-MM-DD).
+
+    Returns:
+        float: CAGR 값.
+    """
+    # 백테스트 기간 (연수 단위)
+    num_years = (pd.to_datetime(end_date) - pd.to_datetime(start_date)).days / 365.0
+
+    # CAGR 계산
+    cagr = (final_value / initial_value) ** (1 / num_years) - 1
+    return cagr
+
+def format_portfolio(portfolio):
+    """선정 종목을 로그 출력용 표 문자열로 변환"""
+    from tabulate import tabulate
+
+    columns = ["Ticker", "Close", "PER", "PBR", "Name"]
+    return tabulate(portfolio[columns], headers=columns, tablefmt="plain")
+
+def plot_backtest_results(dates, portfolio_values, drawdowns, monthly_returns=None):
+    """
+    백테스트 결과를 시각화하는 함수.
+
+    Args:
+        dates (list): 백테스트 기간의 날짜 리스트.
+        portfolio_values (list): 포트폴리오 가치 변화 리스트.
+        drawdowns (list): 낙폭(MDD) 값 리스트.
+        monthly_returns (list): 월별 수익률 리스트 (옵션).
+    """
+    # matplotlib은 그래프가 필요할 때만 로드
+    import matplotlib.pyplot as plt
+
+    # 포트폴리오 가치 변화 그래프
+    plt.figure(figsize=(14, 8))
+    plt.plot(dates, portfolio_values, label="Portfolio Value", color="blue", linewidth=2)
+
+    # MDD 강조
+    mdd_index = drawdowns.index(max(drawdowns))
+    mdd_date = dates[mdd_index]
+    mdd_value = portfolio_values[mdd_index]
+    plt.scatter(mdd_date, mdd_value, color="red", label=f"MDD ({max(drawdowns):.2%})", zorder=5, s=100)
+
+    # 그래프 스타일 설정
+    plt.title("Backtest Results: Portfolio Value", fontsize=16)
+    plt.xlabel("Date", fontsize=12)
+    plt.ylabel("Portfolio Value (KRW)", fontsize=12)
+    plt.legend()
+    plt.grid(alpha=0.7)
+    plt.tight_layout()
+    plt.show()
+
+    # 월별 수익률 그래프 (옵션)
+    if monthly_returns:
+        plt.figure(figsize=(14, 6))
+        plt.bar(range(len(monthly_returns)), [x * 100 for x in monthly_returns], color="green", alpha=0.6)
+        plt.title("Monthly Returns (%)", fontsize=16)
+        plt.xlabel("Month", fontsize=12)
+        plt.ylabel("Return (%)", fontsize=12)
+        plt.grid(axis="y", alpha=0.7)
+        plt.tight_layout()
+        plt.show()
+
+
+def run_backtest(data, strategy, initial_cash=10_000_000, state=None, weighting="equal", cov_window=36,
+                 **strategy_kwargs):
+    """
+    월별 리밸런싱 백테스트를 실행합니다.
+
+    DataFrame을 넘겨도 내부에서 Panel로 변환하므로 펀더멘털(PER, PBR, DIV 등 FLOAT32_COLUMNS)은
+    float32로 반올림된 값이 전략에 전달됩니다. 값이 거의 같은 종목 간 순위가 바뀔 수 있어
+    실제 데이터에서는 float64 DataFrame 기반의 이전 결과와 선정 종목이 약간 다를 수 있습니다.
+
+    Args:
+        data (pd.DataFrame | Panel): Date 인덱스를 가진 종목 데이터 (load_data 결과) 또는 Panel.
+        strategy (callable): (data, date, **kwargs) -> 선정 종목 DataFrame.
+        initial_cash (float): 초기 투자금.
+        state (dict): 이전 실행 결과 (run_backtest 반환값 또는 체크포인트).
+            지정하면 state의 마지막 날짜부터 이어서 새로 추가된 날짜만 진행합니다.
+            data에는 state의 마지막 날짜가 포함되어 있어야 합니다.
+        weighting (str): 비중 결정 방식 (equal, min_variance, risk_parity).
+        cov_window (int): 공분산 추정에 사용할 최근 개월 수 (equal이 아닐 때만 사용).
+        **strategy_kwargs: 전략 함수에 전달할 추가 인자 (예: max_stocks).
+
+    Returns:
+        dict: dates, portfolio_values, monthly_returns, cash, holdings.
+    """
+    # 날짜별 횡단면을 연속 구간으로 조회하기 위해 패널로 변환
+    panel = data if isinstance(data, Panel) else to_panel(data)
+    dates = list(panel.date_index())
+
+    if state is None:
+        cash, holdings = initial_cash, {}
+        portfolio_values, monthly_returns = [initial_cash], [0.0]  # 초기값 설정
+        history, start_idx = [], 0
+        logger.info("백테스트 시작")
+    else:
+        cash, holdings = state["cash"], dict(state["holdings"])
+        portfolio_values, monthly_returns = list(state["portfolio_values"]), list(state["monthly_returns"])
+        # 이전 실행의 마지막 날짜(매도만 남은 월)부터 이어서 진행
+        history, start_idx = list(state["dates"][:-1]), panel.date_position(state["dates"][-1])
+        logger.info(f"백테스트 이어서 실행: {state['dates'][-1]} 이후 {len(dates) - start_idx - 1}개월")
+
+    # 최적화 비중을 쓰면 ChangeRate 롤링 공분산을 유지 (이어서 실행 시 이전 날짜로 먼저 채움)
+    covariance = None
+    if weighting != "equal":
+        if "ChangeRate" not in panel.columns:
+            raise ValueError("Missing required column: ChangeRate")
+        covariance = RollingCovariance(len(panel.tickers), window=cov_window)
+        for i in range(start_idx):
+            rows = panel.date_slice(i)
+            covariance.update(panel.ticker_code[rows], panel.columns["ChangeRate"][rows])
+
+    for i in range(start_idx, len(dates) - 1):  # 마지막 월은 매도만 수행하고 종료
+        date = dates[i]
+        next_month_date = dates[i + 1]  # 익월말 기준 종가 사용
+
+        if covariance is not None:
+            rows = panel.date_slice(i)
+            covariance.update(panel.ticker_code[rows], panel.columns["ChangeRate"][rows])
+
+        # 기존 보유 주식 매도 후 현금화
+        for ticker, shares in list(holdings.items()):
+            try:
+                sell_price = panel.value(i, 'Close', ticker)
+                cash += shares * sell_price
+                del holdings[ticker]
+            except Exception as e:
+                logger.warning(f"Failed to sell Ticker {ticker} on {date}: {e}")
+
+        # 전략 실행 및 종목 선정
+        filtered_data = strategy_filter(panel.cross_section(i), date) # 전략에 사용될 데이터 필터링
+
+        # 전략 실행
+        portfolio = strategy(filtered_data, date, **strategy_kwargs)
+        if portfolio.empty:
+            logger.info(f"No stocks selected on {date}. Portfolio Value: {cash:,.2f}")
+            portfolio_values.append(cash)
+            monthly_returns.append(0.0)
+            continue
+
+        # 매수 가능한 종목별 수량 계산
+        tickers = portfolio['Ticker'].tolist()
+        if covariance is None:
+            allocations = [cash / len(portfolio)] * len(portfolio)
+        else:
+            cov = covariance.covariance([panel.ticker_index[ticker] for ticker in tickers])
+            allocations = (cash * optimize_weights(cov, weighting)).tolist()
+        for ticker, buy_price, allocation in zip(tickers, portfolio['Close'].tolist(), allocations):
+            try:
+                num_shares = int(allocation // buy_price)
+                if num_shares > 0:
+                    executed_price, total_cost = apply_trading_cost(buy_price, num_shares)
+                    cash -= total_cost
+                    holdings[ticker] = num_shares
+            except Exception as e:
+                logger.warning(f"Failed to buy Ticker {ticker} on {date}: {e}")
+
+        # 포트폴리오 가치 계산 (익월말 종가 기준)
+        portfolio_value = cash
+        for ticker, shares in holdings.items():
+            try:
+                close_price = panel.value(i + 1, 'Close', ticker)
+                portfolio_value += shares * close_price
+            except Exception as e:
+                logger.warning(f"Failed to calculate value for Ticker {ticker} on {next_month_date}: {e}")
+
+        # 수익률 계산
+        monthly_return = calculate_monthly_return(portfolio_values[-1], portfolio_value)
+        monthly_returns.append(monthly_return)
+        portfolio_values.append(portfolio_value)
+
+        logger.info(f"{date}: Portfolio Value = {portfolio_value:,.2f}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Selected Stocks:\n{format_portfolio(portfolio)}")
+
+    return {
+        "dates": history + dates[start_idx:],
+        "portfolio_values": portfolio_values,
+        "monthly_returns": monthly_returns,
+        "cash": cash,
+        "holdings": holdings,
+    }
+
+
+def summarize(result, start_date, end_date):
+    """
+    백테스트 결과로부터 성과 지표를 계산합니다.
+
+    Args:
+        result (dict): run_backtest 결과.
+        start_date (str): 백테스트 시작 날짜 (YYYY-MM-DD).
+        end_date (str): 백테스트 종료 날짜 (YYYY-MM-DD).
+
+    Returns:
+        dict: results(DataFrame), drawdowns 및 주요 성과 지표.
+    """
+    dates = result["dates"]
+    portfolio_values = result["portfolio_values"]
+    monthly_returns = result["monthly_returns"]
+
+    max_drawdown, drawdowns = calculate_drawdown(portfolio_values)
+    results = pd.DataFrame({
+        "Date": dates[:-1],  # 마지막 월은 제외
+        "Portfolio Value": portfolio_values[:-1],
+        "Monthly Return": monthly_returns[:-1],
+        "Drawdown": drawdowns[:-1]
+    }).set_index("Date")
+
+    cagr = calculate_cagr(portfolio_values[0], portfolio_values[-1], start_date, end_date)
+    total_return = (results["Portfolio Value"].iloc[-1] / results["Portfolio Value"].iloc[0]) - 1
+    sharpe_ratio = (results["Monthly Return"].mean() - (0.03 / 12)) / results["Monthly Return"].std() * (12 ** 0.5)
+    monthly_returns_std = results["Monthly Return"].std()
+
+    return {
+        "results": results,
+        "drawdowns": drawdowns,
+        "cagr": cagr,
+        "total_return": total_return,
+        "max_drawdown": max_drawdown,
+        "sharpe_ratio": sharpe_ratio,
+        "monthly_volatility": monthly_returns_std,
+    }
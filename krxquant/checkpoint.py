@@ -0,0 +1,198 @@
+"""
+백테스트 체크포인트.
+
+실행 종료 시점의 상태(현금, 보유 종목, 포트폴리오 가치, 낙폭 고점, 데이터 버전)를 JSON으로 저장하고,
+새 월 데이터가 들어오면 전체 기간을 다시 돌리지 않고 마지막 날짜부터 이어서 실행할 수 있게 합니다.
+
+이어서 실행할 때 재사용되는 데이터는 다음과 같으며, 각각 저장 당시의 해시로 검증합니다.
+
+- 체크포인트 마지막 날짜의 횡단면 (보유 종목 매도가 및 다음 종목 선정): data_version
+- 최적화 비중(min_variance, risk_parity)이면 롤링 공분산을 다시 채우는 데 쓰는
+  이전 cov_window개월의 ChangeRate: history_version
+"""
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from krxquant.backtest import calculate_drawdown
+
+CHECKPOINT_FORMAT = 1
+
+
+def data_version(panel, date_idx):
+    """
+    특정 날짜 횡단면의 데이터 버전(해시)을 계산합니다.
+
+    Args:
+        panel (Panel): 패널 데이터.
+        date_idx (int): 날짜 인덱스.
+
+    Returns:
+        str: sha256 hex digest.
+    """
+    rows = panel.date_slice(date_idx)
+    digest = hashlib.sha256()
+    digest.update(str(panel.dates[date_idx]).encode())
+    digest.update("\n".join(panel.tickers[panel.ticker_code[rows]].tolist()).encode())
+    for col in sorted(panel.columns):
+        values = panel.columns[col][rows]
+        digest.update(col.encode())
+        # 조회 기간에 따라 달라질 수 있는 타입(int64/float64 등)에 영향받지 않도록 정규화
+        if np.issubdtype(values.dtype, np.number):
+            digest.update(values.astype(np.float64).tobytes())
+        else:
+            digest.update("\n".join(map(str, values.tolist())).encode())
+    return digest.hexdigest()
+
+
+def history_version(panel, start_date, end_date):
+    """
+    start_date ~ end_date 기간 ChangeRate의 데이터 버전(해시)을 계산합니다.
+
+    Args:
+        panel (Panel): 패널 데이터.
+        start_date: 시작 날짜 (포함).
+        end_date: 종료 날짜 (포함).
+
+    Returns:
+        str: sha256 hex digest.
+    """
+    rows = panel.date_range_slice(start_date, end_date)
+    digest = hashlib.sha256()
+    digest.update(panel.dates[panel.date_code[rows]].astype("datetime64[ns]").tobytes())
+    digest.update("\n".join(panel.tickers[panel.ticker_code[rows]].tolist()).encode())
+    digest.update(panel.columns["ChangeRate"][rows].astype(np.float64).tobytes())
+    return digest.hexdigest()
+
+
+def resume_start(last_date, start_date, weighting=None):
+    """
+    이어서 실행할 때 로드해야 하는 첫 날짜.
+
+    최적화 비중이면 롤링 공분산을 다시 채울 수 있도록 cov_window개월 이전부터 로드합니다
+    (원래 시작일 이전은 제외).
+
+    Args:
+        last_date: 체크포인트의 마지막 날짜.
+        start_date: 백테스트 시작 날짜.
+        weighting (dict): 비중 결정 설정.
+
+    Returns:
+        pd.Timestamp: 로드 시작 날짜.
+    """
+    last_date = pd.Timestamp(last_date)
+    weighting = weighting or {"weighting": "equal"}
+    if weighting["weighting"] == "equal":
+        return last_date
+    return max(last_date - pd.DateOffset(months=weighting["cov_window"]), pd.Timestamp(start_date))
+
+
+def save_checkpoint(path, result, panel, strategy_name, strategy_kwargs, initial_cash, start_date, weighting=None):
+    """
+    백테스트 종료 상태를 저장합니다.
+
+    Args:
+        path (str): 체크포인트 파일 경로 (JSON).
+        result (dict): run_backtest 결과.
+        panel (Panel): 실행에 사용한 패널 (마지막 날짜 포함).
+        strategy_name (str): 전략 이름.
+        strategy_kwargs (dict): 전략 인자.
+        initial_cash (float): 초기 투자금.
+        start_date (str): 백테스트 시작 날짜 (YYYY-MM-DD).
+        weighting (dict): 비중 결정 설정 (run_backtest의 weighting, cov_window).
+    """
+    dates = result["dates"]
+    weighting = weighting or {"weighting": "equal"}
+    portfolio_values = [float(value) for value in result["portfolio_values"]]
+    max_drawdown, _ = calculate_drawdown(portfolio_values)
+    checkpoint = {
+        "format": CHECKPOINT_FORMAT,
+        "strategy": strategy_name,
+        "strategy_kwargs": strategy_kwargs,
+        "weighting": weighting,
+        "initial_cash": float(initial_cash),
+        "start_date": str(start_date),
+        "dates": [pd.Timestamp(date).strftime("%Y-%m-%d") for date in dates],
+        "portfolio_values": portfolio_values,
+        "monthly_returns": [float(value) for value in result["monthly_returns"]],
+        "cash": float(result["cash"]),
+        "holdings": {ticker: int(shares) for ticker, shares in result["holdings"].items()},
+        "peak": max(portfolio_values),
+        "max_drawdown": max_drawdown,
+        "data_version": data_version(panel, panel.date_position(dates[-1])) if dates else None,
+    }
+    if dates and weighting["weighting"] != "equal":
+        checkpoint["history_version"] = history_version(
+            panel, resume_start(dates[-1], start_date, weighting), dates[-1]
+        )
+
+    # 중간에 실패해도 기존 체크포인트가 깨지지 않도록 임시 파일에 쓴 뒤 교체
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path):
+    """
+    체크포인트를 로드합니다. dates는 pd.Timestamp 리스트로 변환됩니다.
+
+    Raises:
+        ValueError: 지원하지 않는 체크포인트 형식인 경우.
+    """
+    with open(path, encoding="utf-8") as f:
+        checkpoint = json.load(f)
+    if checkpoint.get("format") != CHECKPOINT_FORMAT:
+        raise ValueError(f"Unsupported checkpoint format: {checkpoint.get('format')}")
+    checkpoint["dates"] = [pd.Timestamp(date) for date in checkpoint["dates"]]
+    return checkpoint
+
+
+def validate_checkpoint(checkpoint, panel, strategy_name, strategy_kwargs, weighting=None):
+    """
+    체크포인트가 현재 전략·데이터로 이어서 실행 가능한지 검사합니다.
+
+    Args:
+        checkpoint (dict): load_checkpoint 결과.
+        panel (Panel): resume_start 날짜부터 시작하는 패널.
+        strategy_name (str): 전략 이름.
+        strategy_kwargs (dict): 전략 인자.
+        weighting (dict): 비중 결정 설정.
+
+    Raises:
+        ValueError: 전략, 인자, 비중 설정 또는 데이터가 체크포인트와 다른 경우.
+    """
+    if checkpoint["strategy"] != strategy_name or checkpoint["strategy_kwargs"] != strategy_kwargs:
+        raise ValueError(
+            f"Checkpoint was created with {checkpoint['strategy']} {checkpoint['strategy_kwargs']}, "
+            f"not {strategy_name} {strategy_kwargs}"
+        )
+    weighting = weighting or {"weighting": "equal"}
+    if checkpoint.get("weighting", {"weighting": "equal"}) != weighting:
+        raise ValueError(f"Checkpoint was created with weighting {checkpoint['weighting']}, not {weighting}")
+    if not checkpoint["dates"]:
+        raise ValueError("Checkpoint has no processed dates")
+
+    last_date = checkpoint["dates"][-1]
+    try:
+        date_idx = panel.date_position(last_date)
+    except KeyError:
+        raise ValueError(f"Checkpoint date {last_date:%Y-%m-%d} is missing from the data")
+    if data_version(panel, date_idx) != checkpoint["data_version"]:
+        raise ValueError(f"Data for {last_date:%Y-%m-%d} changed since the checkpoint was saved")
+
+    if weighting["weighting"] != "equal":
+        # 공분산을 다시 채우는 기간의 ChangeRate도 저장 당시와 같아야 전체 재실행과 결과가 일치
+        if "history_version" not in checkpoint:
+            raise ValueError("Checkpoint does not record ChangeRate history; rerun without --resume")
+        start = resume_start(last_date, checkpoint["start_date"], weighting)
+        if history_version(panel, start, last_date) != checkpoint["history_version"]:
+            raise ValueError(
+                f"ChangeRate for {start:%Y-%m-%d} ~ {last_date:%Y-%m-%d} changed since the checkpoint was saved"
+            )
@@ -0,0 +1,327 @@
+"""
+krxquant 명령행 진입점.
+
+    python -m krxquant backtest --strategy small_value --start 2020-01-01 --end 2024-11-30
+    python -m krxquant backtest --end 2024-12-31 --checkpoint logs/small_value.json --resume
+    python -m krxquant ingest --start 20150101 --end 20241130
+    python -m krxquant update --start 20150101 --end 20241130 --change-rate
+    python -m krxquant sweep --strategies low_per small_value --max-stocks 10 20 30
+    python -m krxquant backtest --weighting risk_parity --cov-window 36
+    python -m krxquant serve  # 이후 backtest/sweep에 --service 지정 시 DB 대신 공유 메모리 사용
+
+무거운 의존성(pandas, matplotlib, tabulate, pykrx)은 각 서브커맨드가 실행될 때만 로드합니다.
+"""
+import argparse
+import logging
+import os
+import sys
+from datetime import datetime
+
+DEFAULT_DB_PATH = "data/krx_data.db"
+DEFAULT_LOG_DIR = "logs"
+DEFAULT_SERVICE_ADDRESS = "127.0.0.1:6210"
+DEFAULT_BACKTEST_START = "2020-01-01"
+DEFAULT_CASH = 10_000_000
+
+# krxquant.portfolio.WEIGHTINGS (numpy 로드 없이 도움말을 만들기 위해 복제)
+WEIGHTINGS = ("equal", "min_variance", "risk_parity")
+
+
+def _setup_logging(log_dir, name):
+    """logs/ 아래 실행별 로그 파일을 설정합니다."""
+    os.makedirs(log_dir, exist_ok=True)
+    log_file = os.path.join(log_dir, f"{name}.log")
+    logging.basicConfig(
+        filename=log_file,
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        encoding="utf-8"
+    )
+    return log_file
+
+
+def _resolve_strategy(parser, name):
+    from krxquant.strategies import STRATEGIES
+
+    if name not in STRATEGIES:
+        parser.error(f"unknown strategy '{name}' (choose from {', '.join(STRATEGIES)})")
+    return STRATEGIES[name]
+
+
+def _load_panel(args, start_date=None):
+    """데이터 서비스가 지정되면 공유 메모리 Panel을, 아니면 DB에서 Panel을 로드합니다."""
+    start_date = start_date or args.start
+    if args.service:
+        from krxquant.service import DataClient, parse_address
+
+        with DataClient(parse_address(args.service)) as client:
+            return client.attach().select_dates(start_date, args.end)
+
+    from krxquant.query import connect, load_panel
+
+    conn = connect(args.db)
+    try:
+        return load_panel(conn, start_date, args.end)
+    finally:
+        conn.close()
+
+
+def _print_summary(summary):
+    print(f"CAGR: {summary['cagr']:.2%}")  # 퍼센트 형태로 출력
+    print(f"Total Return: {summary['total_return']:.2%}")
+    print(f"Maximum Drawdown: {summary['max_drawdown']:.2%}")
+    print(f"Sharpe Ratio: {summary['sharpe_ratio']:.4f}")
+    print(f"Monthly Volatility: {summary['monthly_volatility']:.2%}")
+
+
+def cmd_backtest(args, parser):
+    from krxquant.backtest import run_backtest, summarize, plot_backtest_results
+    import pandas as pd
+    from krxquant.checkpoint import load_checkpoint, resume_start, save_checkpoint, validate_checkpoint
+
+    strategy = _resolve_strategy(parser, args.strategy)
+    strategy_kwargs = {"max_stocks": args.max_stocks}
+    weighting = {"weighting": args.weighting}
+    if args.weighting != "equal":
+        weighting["cov_window"] = args.cov_window
+    current_time = datetime.now().strftime("%Y-%m-%d_%H%M%S")
+    _setup_logging(args.log_dir, f"{current_time}_{strategy.__name__}")
+
+    if args.resume:
+        if not args.checkpoint:
+            parser.error("--resume requires --checkpoint")
+        # 체크포인트의 마지막 날짜부터 새로 추가된 날짜만 로드하여 이어서 실행
+        try:
+            state = load_checkpoint(args.checkpoint)
+        except (OSError, ValueError) as e:
+            parser.exit(1, f"Cannot resume from {args.checkpoint}: {e}\n")
+        # 시작 날짜와 초기 투자금은 체크포인트 값을 사용하므로 다른 값을 지정하면 오류
+        if args.start is not None and pd.Timestamp(args.start) != pd.Timestamp(state["start_date"]):
+            parser.error(f"--start {args.start} conflicts with checkpoint start date {state['start_date']}")
+        if args.cash is not None and args.cash != state["initial_cash"]:
+            parser.error(f"--cash {args.cash:,.0f} conflicts with checkpoint initial cash {state['initial_cash']:,.0f}")
+        # 최적화 비중이면 롤링 공분산을 다시 채울 수 있도록 cov_window개월 이전부터 로드
+        data = _load_panel(args, start_date=resume_start(state["dates"][-1], state["start_date"], weighting))
+        try:
+            validate_checkpoint(state, data, args.strategy, strategy_kwargs, weighting)
+        except ValueError as e:
+            parser.exit(1, f"Cannot resume from {args.checkpoint}: {e}\n")
+        start_date, initial_cash = state["start_date"], state["initial_cash"]
+    else:
+        state = None
+        start_date = args.start if args.start is not None else DEFAULT_BACKTEST_START
+        initial_cash = args.cash if args.cash is not None else DEFAULT_CASH
+        data = _load_panel(args, start_date=start_date)
+
+    result = run_backtest(data, strategy, initial_cash, state=state, **weighting, **strategy_kwargs)
+    summary = summarize(result, start_date, args.end)
+    _print_summary(summary)
+
+    if args.checkpoint:
+        save_checkpoint(args.checkpoint, result, data, args.strategy, strategy_kwargs, initial_cash, start_date,
+                        weighting)
+
+    if args.plot:
+        # 포트폴리오 가치와 낙폭 그래프
+        plot_backtest_results(result["dates"], result["portfolio_values"], summary["drawdowns"])
+    return 0
+
+
+def cmd_ingest(args, parser):
+    from krxquant.ingest import ingest_monthly_data
+    from krxquant.query import connect
+
+    # 오늘 날짜로 파일 이름 설정
+    _setup_logging(args.log_dir, datetime.now().strftime("%Y-%m-%d"))
+
+    conn = connect(args.db)
+    try:
+        ingest_monthly_data(conn, args.start, args.end, tickers=args.tickers, delay=args.delay)
+    finally:
+        conn.close()
+    return 0
+
+
+def cmd_update(args, parser):
+    from krxquant.ingest import update_market_cap_by_ticker
+    from krxquant.query import connect, update_change_rate
+
+    _setup_logging(args.log_dir, datetime.now().strftime("%Y-%m-%d"))
+
+    conn = connect(args.db)
+    try:
+        update_market_cap_by_ticker(conn, args.start, args.end)
+        if args.change_rate:
+            update_change_rate(conn)
+            print("ChangeRate 계산 및 업데이트 완료!")
+    finally:
+        conn.close()
+    return 0
+
+
+# 스윕 워커 프로세스별 데이터 (initializer에서 한 번만 전달)
+_sweep_data = None
+
+
+def _init_sweep_worker(data):
+    global _sweep_data
+    _sweep_data = data
+
+
+def _attach_sweep_worker(service, start_date, end_date):
+    from krxquant.service import DataClient, parse_address
+
+    global _sweep_data
+    with DataClient(parse_address(service)) as client:
+        _sweep_data = client.attach().select_dates(start_date, end_date)
+
+
+def _run_sweep_case(case):
+    from krxquant.backtest import run_backtest, summarize
+    from krxquant.strategies import STRATEGIES
+
+    name, max_stocks, weighting, cov_window, cash, start, end = case
+    result = run_backtest(_sweep_data, STRATEGIES[name], cash, weighting=weighting, cov_window=cov_window,
+                          max_stocks=max_stocks)
+    summary = summarize(result, start, end)
+    return {
+        "Strategy": name,
+        "MaxStocks": max_stocks,
+        "Weighting": weighting,
+        "CAGR": summary["cagr"],
+        "TotalReturn": summary["total_return"],
+        "MDD": summary["max_drawdown"],
+        "Sharpe": summary["sharpe_ratio"],
+    }
+
+
+def cmd_sweep(args, parser):
+    import pandas as pd
+
+    for name in args.strategies:
+        _resolve_strategy(parser, name)
+
+    current_time = datetime.now().strftime("%Y-%m-%d_%H%M%S")
+    _setup_logging(args.log_dir, f"{current_time}_sweep")
+    logging.getLogger("krxquant.backtest").setLevel(logging.WARNING)
+
+    data = _load_panel(args)
+
+    cases = [
+        (name, max_stocks, weighting, args.cov_window, args.cash, args.start, args.end)
+        for name in args.strategies
+        for max_stocks in args.max_stocks
+        for weighting in args.weightings
+    ]
+    if args.jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # 데이터 서비스 사용 시 워커가 공유 메모리에 직접 붙어 복사 비용을 없앰
+        if args.service:
+            initializer, initargs = _attach_sweep_worker, (args.service, args.start, args.end)
+        else:
+            initializer, initargs = _init_sweep_worker, (data,)
+        with ProcessPoolExecutor(args.jobs, initializer=initializer, initargs=initargs) as pool:
+            rows = list(pool.map(_run_sweep_case, cases))
+    else:
+        _init_sweep_worker(data)
+        rows = [_run_sweep_case(case) for case in cases]
+
+    print(pd.DataFrame(rows).to_string(index=False))
+    return 0
+
+
+def cmd_serve(args, parser):
+    from krxquant.query import connect, load_panel
+    from krxquant.service import DataServer, parse_address
+
+    _setup_logging(args.log_dir, f"{datetime.now().strftime('%Y-%m-%d')}_serve")
+
+    conn = connect(args.db)
+    try:
+        panel = load_panel(conn, args.start, args.end)
+    finally:
+        conn.close()
+
+    server = DataServer(panel, parse_address(args.address))
+    del panel
+    host, port = server.address
+    print(f"Serving {len(server.panel):,} rows ({server.panel.nbytes / 1e6:,.1f} MB) on {host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def build_parser():
+    # 모든 서브커맨드 공통 옵션
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--db", default=DEFAULT_DB_PATH, help="SQLite 데이터베이스 경로")
+    common.add_argument("--log-dir", default=DEFAULT_LOG_DIR, help="로그 저장 디렉터리")
+
+    # DB 대신 실행 중인 데이터 서비스(krxquant serve)의 공유 메모리를 사용
+    service = argparse.ArgumentParser(add_help=False)
+    service.add_argument("--service", nargs="?", const=DEFAULT_SERVICE_ADDRESS, metavar="HOST:PORT",
+                         help=f"데이터 서비스 사용 (기본 {DEFAULT_SERVICE_ADDRESS})")
+
+    parser = argparse.ArgumentParser(prog="krxquant", description="KRX 퀀트 전략 백테스트 도구")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    backtest = subparsers.add_parser("backtest", parents=[common, service], help="백테스트 실행")
+    backtest.add_argument("--strategy", default="small_value", help="전략 이름 (low_per, low_per_high_div, small_value)")
+    backtest.add_argument("--start", help=f"시작 날짜 (YYYY-MM-DD, 기본 {DEFAULT_BACKTEST_START}, "
+                                          "--resume 시 체크포인트 값 사용)")
+    backtest.add_argument("--end", default="2024-11-30", help="종료 날짜 (YYYY-MM-DD)")
+    backtest.add_argument("--cash", type=float,
+                          help=f"초기 투자금 (기본 {DEFAULT_CASH:,}, --resume 시 체크포인트 값 사용)")
+    backtest.add_argument("--max-stocks", type=int, default=20, help="선택할 최대 종목 수")
+    backtest.add_argument("--weighting", choices=WEIGHTINGS, default="equal", help="종목 비중 결정 방식")
+    backtest.add_argument("--cov-window", type=int, default=36, help="공분산 추정 기간 (개월)")
+    backtest.add_argument("--plot", action="store_true", help="결과 그래프 표시")
+    backtest.add_argument("--checkpoint", metavar="PATH", help="종료 상태를 저장할 체크포인트 파일 (JSON)")
+    backtest.add_argument("--resume", action="store_true",
+                          help="체크포인트부터 새로 추가된 날짜만 이어서 실행 (--checkpoint 필요)")
+    backtest.set_defaults(func=cmd_backtest)
+
+    ingest = subparsers.add_parser("ingest", parents=[common], help="pykrx 월별 데이터 수집")
+    ingest.add_argument("--start", default="20150101", help="시작 날짜 (YYYYMMDD)")
+    ingest.add_argument("--end", default="20241130", help="종료 날짜 (YYYYMMDD)")
+    ingest.add_argument("--tickers", nargs="+", help="수집할 종목 코드 (기본: 전체 상장 종목)")
+    ingest.add_argument("--delay", type=float, default=1.0, help="종목별 호출 간격(초)")
+    ingest.set_defaults(func=cmd_ingest)
+
+    update = subparsers.add_parser("update", parents=[common], help="MarketCap/SharesOutstanding 갱신")
+    update.add_argument("--start", default="20150101", help="시작 날짜 (YYYYMMDD)")
+    update.add_argument("--end", default="20241130", help="종료 날짜 (YYYYMMDD)")
+    update.add_argument("--change-rate", action="store_true", help="ChangeRate(%%)도 다시 계산")
+    update.set_defaults(func=cmd_update)
+
+    sweep = subparsers.add_parser("sweep", parents=[common, service], help="전략/파라미터 조합 백테스트")
+    sweep.add_argument("--strategies", nargs="+", default=["low_per", "low_per_high_div", "small_value"])
+    sweep.add_argument("--max-stocks", nargs="+", type=int, default=[20])
+    sweep.add_argument("--weightings", nargs="+", choices=WEIGHTINGS, default=["equal"])
+    sweep.add_argument("--cov-window", type=int, default=36, help="공분산 추정 기간 (개월)")
+    sweep.add_argument("--start", default="2020-01-01", help="시작 날짜 (YYYY-MM-DD)")
+    sweep.add_argument("--end", default="2024-11-30", help="종료 날짜 (YYYY-MM-DD)")
+    sweep.add_argument("--cash", type=float, default=DEFAULT_CASH, help="초기 투자금")
+    sweep.add_argument("--jobs", type=int, default=1, help="병렬 워커 프로세스 수")
+    sweep.set_defaults(func=cmd_sweep)
+
+    serve = subparsers.add_parser("serve", parents=[common], help="공유 메모리 데이터 서비스 실행")
+    serve.add_argument("--start", default="2015-01-01", help="시작 날짜 (YYYY-MM-DD)")
+    serve.add_argument("--end", default="2099-12-31", help="종료 날짜 (YYYY-MM-DD)")
+    serve.add_argument("--address", default=DEFAULT_SERVICE_ADDRESS, metavar="HOST:PORT", help="수신 주소")
+    serve.set_defaults(func=cmd_serve)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    return args.func(args, parser)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+import time
+import logging
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def create_table(conn):
+    """stock_monthly_data 테이블을 생성합니다 (추가된 속성 포함)."""
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS stock_monthly_data (
+        Date TEXT,
+        Ticker TEXT,
+        Name TEXT,
+        Open REAL,
+        High REAL,
+        Low REAL,
+        Close REAL,
+        Volume REAL,
+        ChangeRate REAL,
+        PER REAL,
+        BPS REAL,
+        PBR REAL,
+        EPS REAL,
+        DPS REAL,
+        DIV REAL,
+        PRIMARY KEY (Date, Ticker)
+    )
+    """)
+    conn.commit()
+
+
+def ingest_monthly_data(conn, start_date, end_date, tickers=None, delay=1.0):
+    """
+    pykrx에서 월별 OHLCV 및 Fundamental 데이터를 받아 DB에 저장합니다.
+
+    Args:
+        conn (sqlite3.Connection): 데이터베이스 연결.
+        start_date (str): 시작 날짜 (YYYYMMDD).
+        end_date (str): 종료 날짜 (YYYYMMDD).
+        tickers (list): 수집할 종목 코드 목록. None이면 전체 상장 종목.
+        delay (float): 호출 제한을 피하기 위한 종목별 대기 시간(초).
+    """
+    # pykrx는 수집 시에만 필요하므로 지연 로드
+    from pykrx import stock
+
+    create_table(conn)
+    cursor = conn.cursor()
+
+    if tickers is None:
+        tickers = stock.get_market_ticker_list()
+
+    for ticker in tickers:
+        # DB에서 해당 ticker와 기간의 데이터가 있는지 확인
+        cursor.execute("""
+            SELECT 1 FROM stock_monthly_data
+            WHERE Ticker = ? AND Date BETWEEN ? AND ?
+            LIMIT 1
+        """, (ticker, start_date, end_date))
+        exists = cursor.fetchone()
+
+        if exists:
+            logger.info(f"Data already exists for {ticker} in {start_date} - {end_date}")
+            continue  # 이미 존재하는 경우 건너뜀
+
+        try:
+            # 호출 제한을 피하기 위해 대기
+            time.sleep(delay)
+
+            # OHLCV 데이터
+            ohlcv = stock.get_market_ohlcv(start_date, end_date, ticker, freq="m")
+            ohlcv.index = pd.to_datetime(ohlcv.index)
+            ohlcv['ChangeRate'] = round(ohlcv['종가'].pct_change(), 2)
+
+            # Fundamental 데이터 (BPS PER PBR EPS DIV DPS)
+            fundamental = stock.get_market_fundamental_by_date(start_date, end_date, ticker, freq="m")
+
+            # 필요한 컬럼이 모두 있는지 확인
+            required_columns = ['TRD_DD', 'BPS', 'PER', 'PBR', 'EPS', 'DVD_YLD', 'DPS']
+            missing_columns = [col for col in required_columns if col not in fundamental.columns]
+            if missing_columns:
+                logger.warning(f"Missing columns {missing_columns} for {ticker} ({start_date} to {end_date})")
+                continue  # 다음 루프로 이동
+
+            if fundamental.empty:
+                logger.warning(f"No data available for {ticker} ({start_date} to {end_date})")
+                continue
+
+            # 필요한 컬럼만 선택
+            fundamental = fundamental[required_columns]
+            fundamental.index = pd.to_datetime(fundamental.index)
+
+            # 데이터 통합
+            combined = pd.concat([ohlcv, fundamental], axis=1)
+            combined.fillna(pd.NA, inplace=True)
+
+            # 종목 이름
+            name = stock.get_market_ticker_name(ticker)
+
+            # 데이터 삽입
+            for index, row in combined.iterrows():
+                cursor.execute("""
+                    INSERT OR REPLACE INTO stock_monthly_data
+                    (Date, Ticker, Name, Open, High, Low, Close, Volume, ChangeRate, PER, BPS, PBR, EPS, DPS, DIV)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    index.strftime('%Y-%m-%d'), ticker, name, row['시가'], row['고가'], row['저가'], row['종가'],
+                    row['거래량'], row['ChangeRate'], row['PER'], row['BPS'], round(row['PBR'], 2), row['EPS'],
+                    row['DPS'], round(row['DIV'], 2)
+                ))
+            conn.commit()
+            logger.info(f"Processed {ticker} ({name}) for {start_date}-{end_date}")
+
+        except Exception as e:
+            error_message = f"Error processing {ticker} for {start_date}-{end_date}: {e}"
+            logger.error(error_message)
+            print(error_message)
+
+
+def update_market_cap_by_ticker(conn, start_date, end_date):
+    """
+    특정 Ticker에 대해 start_date ~ end_date 기간의 MarketCap 및 SharesOutstanding 데이터를 업데이트.
+    """
+    from pykrx.stock import get_market_cap_by_date
+
+    # 기존 데이터에서 Ticker 목록 가져오기
+    query = "SELECT DISTINCT Ticker FROM stock_monthly_data WHERE MarketCap is NULL or SharesOutstanding is NULL"
+    tickers = pd.read_sql(query, conn)['Ticker'].tolist()
+    print(f"종목수 : {len(tickers)}")
+
+    updates = []  # 업데이트할 데이터를 저장할 리스트
+
+    for ticker in tickers:
+        try:
+            # PyKrx를 사용해 월말 데이터 가져오기
+            market_cap_data = get_market_cap_by_date(start_date, end_date, ticker=ticker, freq="m")
+
+            for date, row in market_cap_data.iterrows():
+                market_cap = int(row['시가총액'])
+                shares_outstanding = int(row['상장주식수'])
+                date_str = pd.to_datetime(date).strftime("%Y-%m-%d")  # Date 포맷 변환
+
+                # 업데이트 리스트에 추가
+                updates.append((market_cap, shares_outstanding, date_str, ticker))
+
+        except Exception as e:
+            print(f"Error fetching data for Ticker {ticker}: {e}")
+
+    # 데이터베이스에 업데이트
+    if updates:
+        cursor = conn.cursor()
+        cursor.executemany("""
+            UPDATE stock_monthly_data
+            SET MarketCap = ?, SharesOutstanding = ?
+            WHERE Date = ? AND Ticker = ?
+        """, updates)
+        conn.commit()
+        print(f"Updated {len(updates)} rows.")
@@ -0,0 +1,234 @@
+"""
+메모리 효율적인 패널 데이터 표현.
+
+load_data가 반환하는 DataFrame(행마다 중복되는 DatetimeIndex, object 타입 Ticker/Name,
+float64 컬럼)을 다음과 같은 컬럼 지향 배열로 압축합니다.
+
+- 날짜: 고유 날짜 배열 + 행별 int32 코드
+- 종목: 고유 종목코드 배열 + 행별 정수 코드 (Name은 종목별 배열로 분리)
+- 펀더멘털(PER, PBR, EPS, ...): float32, 가격/거래량/시가총액은 원래 타입 유지
+- bool 컬럼: 행별 비트 플래그 하나로 패킹
+
+행은 (날짜, 종목코드) 순으로 정렬되어 있어 특정 날짜의 횡단면은 각 컬럼의 연속 구간이 됩니다.
+"""
+import numpy as np
+import pandas as pd
+
+# float32로도 정밀도가 충분한 펀더멘털 컬럼 (가격·거래량·시가총액은 원래 타입 유지)
+FLOAT32_COLUMNS = ("ChangeRate", "PER", "BPS", "PBR", "EPS", "DPS", "DIV")
+
+
+def _code_dtype(n):
+    """n개의 고유값을 표현할 수 있는 가장 작은 정수 타입"""
+    return np.int16 if n < np.iinfo(np.int16).max else np.int32
+
+
+def _flag_dtype(n):
+    """n개의 플래그를 담을 수 있는 가장 작은 부호 없는 정수 타입"""
+    for dtype in (np.uint8, np.uint16, np.uint32, np.uint64):
+        if n <= np.iinfo(dtype).bits:
+            return dtype
+    raise ValueError(f"Too many flag columns: {n}")
+
+
+class Panel:
+    """
+    (날짜, 종목) 패널 데이터의 압축 표현.
+
+    Attributes:
+        dates (np.ndarray): 고유 날짜 (datetime64[ns], 정렬).
+        tickers (np.ndarray): 고유 종목코드 (정렬).
+        names (np.ndarray): 종목코드별 종목명 (가장 최근 값).
+        date_code (np.ndarray): 행별 날짜 코드 (int32).
+        ticker_code (np.ndarray): 행별 종목 코드.
+        columns (dict): 컬럼명 -> 행별 값 배열.
+        flags (np.ndarray): 행별 비트 플래그 (flag_names[i]가 i번째 비트).
+        flag_names (tuple): 플래그 컬럼명.
+        date_offsets (np.ndarray): 날짜 i의 행 구간은 date_offsets[i]:date_offsets[i + 1].
+        column_order (list): 원본 DataFrame의 컬럼 순서.
+        base (object): 배열 버퍼의 소유자 (공유 메모리 블록 또는 원본 Panel). 뷰보다 먼저 해제되지 않도록 유지.
+    """
+
+    def __init__(self, dates, tickers, names, date_code, ticker_code, columns,
+                 flags=None, flag_names=(), column_order=None):
+        self.dates = dates
+        self.tickers = tickers
+        self.names = names
+        self.date_code = date_code
+        self.ticker_code = ticker_code
+        self.columns = columns
+        self.flags = flags if flags is not None else np.zeros(len(date_code), dtype=np.uint8)
+        self.flag_names = tuple(flag_names)
+        self.column_order = column_order or ["Ticker", "Name", *columns, *self.flag_names]
+        self.date_offsets = np.searchsorted(date_code, np.arange(len(dates) + 1))
+        self.ticker_index = {ticker: code for code, ticker in enumerate(tickers.tolist())}
+        self.base = None
+
+    def __getstate__(self):
+        # 피클 시 배열은 복사되므로 버퍼 소유자(공유 메모리 등)는 전달하지 않음
+        state = self.__dict__.copy()
+        state["base"] = None
+        return state
+
+    def __len__(self):
+        return len(self.date_code)
+
+    @property
+    def nbytes(self):
+        """패널이 차지하는 배열 메모리 (바이트, 종목명 문자열 제외)"""
+        arrays = [self.dates, self.tickers, self.date_code, self.ticker_code, self.flags,
+                  self.date_offsets, *self.columns.values()]
+        return sum(array.nbytes for array in arrays)
+
+    def date_index(self):
+        """고유 날짜를 DatetimeIndex로 반환"""
+        return pd.DatetimeIndex(self.dates, name="Date")
+
+    def date_slice(self, date_idx):
+        """날짜 인덱스에 해당하는 행 구간"""
+        return slice(int(self.date_offsets[date_idx]), int(self.date_offsets[date_idx + 1]))
+
+    def date_position(self, date):
+        """
+        날짜의 인덱스를 찾습니다.
+
+        Raises:
+            KeyError: 패널에 없는 날짜인 경우.
+        """
+        value = pd.Timestamp(date).to_datetime64()
+        pos = int(np.searchsorted(self.dates, value))
+        if pos == len(self.dates) or self.dates[pos] != value:
+            raise KeyError(f"{date} not in panel")
+        return pos
+
+    def _date_bounds(self, start_date, end_date):
+        """start_date ~ end_date (양 끝 포함) 구간의 날짜 인덱스 범위"""
+        lo = int(np.searchsorted(self.dates, pd.Timestamp(start_date).to_datetime64(), side="left"))
+        hi = int(np.searchsorted(self.dates, pd.Timestamp(end_date).to_datetime64(), side="right"))
+        return lo, hi
+
+    def date_range_slice(self, start_date, end_date):
+        """start_date ~ end_date (양 끝 포함) 구간의 행 슬라이스"""
+        lo, hi = self._date_bounds(start_date, end_date)
+        return slice(int(self.date_offsets[lo]), int(self.date_offsets[hi]))
+
+    def select_dates(self, start_date, end_date):
+        """
+        start_date ~ end_date 구간만 포함하는 Panel을 반환합니다.
+
+        날짜 코드를 제외한 배열은 복사하지 않고 원본(공유 메모리 포함)의 뷰를 사용합니다.
+        """
+        lo, hi = self._date_bounds(start_date, end_date)
+        rows = slice(int(self.date_offsets[lo]), int(self.date_offsets[hi]))
+        panel = Panel(
+            self.dates[lo:hi], self.tickers, self.names,
+            (self.date_code[rows] - lo).astype(np.int32), self.ticker_code[rows],
+            {col: values[rows] for col, values in self.columns.items()},
+            flags=self.flags[rows], flag_names=self.flag_names, column_order=self.column_order,
+        )
+        panel.base = self
+        return panel
+
+    def flag(self, name):
+        """플래그 컬럼을 bool 배열로 반환"""
+        bit = self.flag_names.index(name)
+        return ((self.flags >> bit) & 1).astype(bool)
+
+    def row_of(self, date_idx, ticker):
+        """
+        특정 날짜·종목의 행 번호를 찾습니다.
+
+        Raises:
+            KeyError: 해당 날짜에 종목 데이터가 없는 경우.
+        """
+        code = self.ticker_index[ticker]
+        rows = self.date_slice(date_idx)
+        codes = self.ticker_code[rows]
+        pos = int(np.searchsorted(codes, code))
+        if pos == len(codes) or codes[pos] != code:
+            raise KeyError(f"{ticker} not found on {self.dates[date_idx]}")
+        return rows.start + pos
+
+    def value(self, date_idx, column, ticker):
+        """특정 날짜·종목의 컬럼 값"""
+        return self.columns[column][self.row_of(date_idx, ticker)]
+
+    def cross_section(self, date_idx):
+        """특정 날짜의 횡단면을 기존 DataFrame 형태로 반환"""
+        return from_panel(self, self.date_slice(date_idx))
+
+
+def to_panel(data):
+    """
+    load_data 형태의 DataFrame을 Panel로 변환합니다.
+
+    Args:
+        data (pd.DataFrame): Date 인덱스와 Ticker, Name 컬럼을 가진 종목 데이터.
+
+    Returns:
+        Panel: 압축된 패널 데이터.
+    """
+    column_order = list(data.columns)
+    frame = data.reset_index()
+
+    dates, date_code = np.unique(frame["Date"].to_numpy(dtype="datetime64[ns]"), return_inverse=True)
+    tickers, ticker_code = np.unique(frame["Ticker"].to_numpy(dtype=str), return_inverse=True)
+
+    # (날짜, 종목) 순 정렬 → 날짜별 횡단면이 연속 구간이 됨
+    order = np.lexsort((ticker_code, date_code))
+    date_code = date_code[order].astype(np.int32)
+    ticker_code = ticker_code[order].astype(_code_dtype(len(tickers)))
+
+    # 종목명은 핫 프레임에서 분리하여 종목별로 한 번만 보관
+    names = np.empty(len(tickers), dtype=object)
+    if "Name" in frame.columns:
+        names[ticker_code] = frame["Name"].to_numpy(dtype=object)[order]
+
+    columns, flag_columns = {}, []
+    for col in column_order:
+        if col in ("Ticker", "Name"):
+            continue
+        values = frame[col].to_numpy()[order]
+        if values.dtype == bool:
+            flag_columns.append((col, values))
+        elif col in FLOAT32_COLUMNS:
+            columns[col] = values.astype(np.float32)
+        else:
+            columns[col] = np.ascontiguousarray(values)
+
+    flags = np.zeros(len(order), dtype=_flag_dtype(len(flag_columns)))
+    for bit, (_, values) in enumerate(flag_columns):
+        flags |= values.astype(flags.dtype) << flags.dtype.type(bit)
+
+    return Panel(
+        dates, tickers, names, date_code, ticker_code, columns,
+        flags=flags, flag_names=[col for col, _ in flag_columns], column_order=column_order,
+    )
+
+
+def from_panel(panel, rows=slice(None)):
+    """
+    Panel(의 일부 행)을 load_data 형태의 DataFrame으로 복원합니다.
+
+    Args:
+        panel (Panel): 패널 데이터.
+        rows (slice | np.ndarray): 복원할 행 구간 또는 인덱스.
+
+    Returns:
+        pd.DataFrame: Date 인덱스를 가진 종목 데이터 (float32 컬럼은 float64로 복원).
+    """
+    ticker_code = panel.ticker_code[rows]
+    index = pd.DatetimeIndex(panel.dates[panel.date_code[rows]], name="Date")
+
+    out = {
+        "Ticker": panel.tickers[ticker_code].astype(object),
+        "Name": panel.names[ticker_code],
+    }
+    for col, values in panel.columns.items():
+        values = values[rows]
+        out[col] = values.astype(np.float64) if values.dtype == np.float32 else values
+    flags = panel.flags[rows]
+    for bit, col in enumerate(panel.flag_names):
+        out[col] = ((flags >> bit) & 1).astype(bool)
+
+    return pd.DataFrame(out, index=index)[[col for col in panel.column_order if col in out]]
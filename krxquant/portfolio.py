@@ -0,0 +1,255 @@
+"""
+포트폴리오 구성: 롤링 공분산 추정과 비중 최적화.
+
+- RollingCovariance: 종목 유니버스 전체의 최근 window개월 수익률(ChangeRate)을 링 버퍼로 유지합니다.
+  매월 갱신은 O(종목 수)이며, 리밸런싱 시 선정된 K개 종목의 공분산만 (W x K) 행렬곱 한 번으로 계산하고
+  Ledoit-Wolf 방식으로 대각 타깃에 수축합니다.
+- min_variance_weights / risk_parity_weights: (..., K, K) 형태의 공분산 배치에 대해 비중을 계산합니다.
+  공매도 금지 최소분산은 active-set 방법으로 정확한 최적해를 구합니다.
+"""
+import numpy as np
+
+WEIGHTINGS = ("equal", "min_variance", "risk_parity")
+
+
+def _ledoit_wolf_shrinkage(centered, sample_cov):
+    """
+    Ledoit-Wolf (2004) 수축 강도 (타깃: 평균 분산 x 단위행렬).
+
+    Args:
+        centered (np.ndarray): (T, K) 평균을 뺀 수익률.
+        sample_cov (np.ndarray): (K, K) centered.T @ centered / T.
+
+    Returns:
+        float: 0 ~ 1 사이의 수축 강도.
+    """
+    num_obs, num_assets = centered.shape
+    target = np.trace(sample_cov) / num_assets
+    delta = ((sample_cov - target * np.eye(num_assets)) ** 2).sum()
+    if delta <= 0:
+        return 1.0
+
+    # (1/T^2) * sum_t ||x_t x_t' - S||_F^2
+    norms = (centered ** 2).sum(axis=1)
+    quad = np.einsum("ti,ij,tj->t", centered, sample_cov, centered)
+    beta = (norms ** 2 - 2 * quad + (sample_cov ** 2).sum()).sum() / num_obs ** 2
+    return float(np.clip(beta / delta, 0.0, 1.0))
+
+
+class RollingCovariance:
+    """
+    종목별 월 수익률의 롤링 공분산.
+
+    Args:
+        num_assets (int): 전체 종목 수 (Panel.tickers 길이).
+        window (int): 공분산 추정에 사용할 최근 개월 수.
+        min_periods (int): 표본 분산을 사용하기 위한 최소 관측 개월 수. 미만인 종목은 타깃 분산을 사용.
+        shrinkage (float): 고정 수축 강도. None이면 Ledoit-Wolf 추정값 사용.
+    """
+
+    def __init__(self, num_assets, window=36, min_periods=12, shrinkage=None):
+        self.window = window
+        self.min_periods = min_periods
+        self.shrinkage = shrinkage
+        self.returns = np.full((window, num_assets), np.nan)
+        self.filled = 0
+        self._pos = 0
+
+    def update(self, codes, returns):
+        """
+        한 달치 수익률을 추가하고 window를 벗어난 가장 오래된 달을 제거합니다.
+
+        Args:
+            codes (np.ndarray): 종목 코드 (Panel.ticker_code).
+            returns (np.ndarray): 종목별 수익률 (ChangeRate). 데이터가 없는 종목은 NaN으로 처리.
+        """
+        row = self.returns[self._pos]
+        row.fill(np.nan)
+        row[codes] = returns
+        self._pos = (self._pos + 1) % self.window
+        self.filled = min(self.filled + 1, self.window)
+
+    def covariance(self, codes):
+        """
+        선택 종목의 수축 공분산 행렬을 계산합니다.
+
+        결측 월은 해당 종목 평균으로 대체(편차 0)한 뒤 종목별 관측 수로 분산을 보정하므로
+        결과는 항상 양의 준정부호입니다.
+
+        Args:
+            codes (array-like): 종목 코드 (K개).
+
+        Returns:
+            np.ndarray: (K, K) 공분산 행렬.
+        """
+        codes = np.asarray(codes)
+        num_assets = len(codes)
+        if self.filled < 2:
+            return np.eye(num_assets)
+
+        window = self.returns[:, codes]
+        observed = ~np.isnan(window)
+        counts = observed.sum(axis=0)
+        means = np.nansum(window, axis=0) / np.maximum(counts, 1)
+        centered = np.where(observed, window - means, 0.0)
+
+        sample_cov = centered.T @ centered / self.filled
+        if self.shrinkage is None:
+            shrinkage = _ledoit_wolf_shrinkage(centered, sample_cov)
+        else:
+            shrinkage = self.shrinkage
+
+        # 종목별 관측 수에 맞춰 분산을 보정 (D S D 형태라 준정부호 유지)
+        valid = counts >= max(self.min_periods, 2)
+        scale = np.sqrt(self.filled / np.maximum(counts - 1, 1))
+        cov = sample_cov * np.outer(scale, scale)
+
+        target = cov.diagonal()[valid].mean() if valid.any() else 1.0
+        cov = (1 - shrinkage) * cov + shrinkage * target * np.eye(num_assets)
+
+        # 관측이 부족한 종목은 타깃(평균 분산, 상관 0)으로 대체
+        cov[~valid, :] = 0.0
+        cov[:, ~valid] = 0.0
+        cov[~valid, ~valid] = target
+        return cov
+
+
+def _min_variance_subset(cov, free):
+    """free 종목만으로 합계 1 제약 최소분산 비중을 구합니다 (나머지 종목은 0)."""
+    weights = np.zeros(len(free))
+    inverse_ones = np.linalg.solve(cov[np.ix_(free, free)], np.ones(free.sum()))
+    weights[free] = inverse_ones / inverse_ones.sum()
+    return weights
+
+
+def _long_only_min_variance(cov, tol=1e-10):
+    """
+    공매도 금지 최소분산 비중 (primal active-set 방법).
+
+    min w'Σw  s.t.  Σw = 1, w >= 0 를 균등 비중(실행 가능해)에서 시작하여 풉니다.
+
+    - 현재 자유 종목으로 푼 해를 향해 이동하다가 비중이 0에 닿는 종목이 있으면 그 종목만 고정(제외)
+    - 해에 도달하면 KKT 조건을 확인하여, 제외된 종목 중 기울기 조건을 가장 크게 위반하는 종목을 다시 자유화
+    - 위반 종목이 없으면 최적해
+
+    Args:
+        cov (np.ndarray): (K, K) 양의 정부호 공분산 행렬.
+        tol (float): KKT 조건 및 이동량 판정 허용 오차 (분산 규모에 대한 상대값).
+
+    Returns:
+        np.ndarray: (K,) 비중.
+    """
+    num_assets = len(cov)
+    weights = np.full(num_assets, 1.0 / num_assets)
+    free = np.ones(num_assets, dtype=bool)
+    scale = np.abs(np.diagonal(cov)).max()
+
+    # 고정/해제가 순환하지 않는 한 유한 번에 종료 (안전장치로 반복 횟수 제한)
+    for _ in range(10 * num_assets + 10):
+        target = _min_variance_subset(cov, free)
+        step = target - weights
+
+        if np.abs(step).max() <= 1e-12:
+            # 제외 종목 i의 KKT 조건: (Σw)_i >= λ (λ = 자유 종목의 한계 분산)
+            gradient = cov @ weights
+            multiplier = gradient[free].mean()
+            violation = np.where(free, 0.0, gradient - multiplier)
+            worst = int(np.argmin(violation))
+            if violation[worst] >= -tol * scale:
+                break
+            free[worst] = True
+            continue
+
+        # 자유 종목 중 먼저 0에 닿는 종목까지만 이동
+        decreasing = free & (step < 0)
+        ratios = np.full(num_assets, np.inf)
+        ratios[decreasing] = -weights[decreasing] / step[decreasing]
+        blocking = int(np.argmin(ratios))
+        if ratios[blocking] >= 1.0:
+            weights = target
+        else:
+            weights = weights + ratios[blocking] * step
+            weights[blocking] = 0.0
+            free[blocking] = False
+
+    weights = np.where(free, np.maximum(weights, 0.0), 0.0)
+    return weights / weights.sum()
+
+
+def min_variance_weights(cov, long_only=True):
+    """
+    최소분산 포트폴리오 비중 (합계 1).
+
+    long_only이면 공매도 금지 제약을 active-set 방법으로 정확히 풉니다 (_long_only_min_variance).
+
+    Args:
+        cov (np.ndarray): (..., K, K) 공분산 행렬 배치.
+        long_only (bool): 공매도 금지 여부.
+
+    Returns:
+        np.ndarray: (..., K) 비중.
+    """
+    cov = np.asarray(cov, dtype=np.float64)
+    if not long_only:
+        inverse_ones = np.linalg.solve(cov, np.ones(cov.shape[:-1])[..., None])[..., 0]
+        return inverse_ones / inverse_ones.sum(axis=-1, keepdims=True)
+
+    # 배치 원소마다 활성 집합이 달라 행렬별로 풂 (K는 보유 종목 수 수준으로 작음)
+    weights = np.empty(cov.shape[:-1])
+    for index in np.ndindex(cov.shape[:-2]):
+        weights[index] = _long_only_min_variance(cov[index])
+    return weights
+
+
+def risk_parity_weights(cov, max_iter=200, tol=1e-10):
+    """
+    위험 균형(Equal Risk Contribution) 포트폴리오 비중 (합계 1).
+
+    min 0.5 w'Σw - Σ log(w_i) / K 를 순환 좌표 하강법으로 풀며, 배치 차원은 한 번에 처리합니다.
+
+    Args:
+        cov (np.ndarray): (..., K, K) 공분산 행렬 배치.
+        max_iter (int): 최대 반복 횟수.
+        tol (float): 수렴 판정 기준 (비중 변화량).
+
+    Returns:
+        np.ndarray: (..., K) 비중.
+    """
+    cov = np.asarray(cov, dtype=np.float64)
+    num_assets = cov.shape[-1]
+    variances = np.diagonal(cov, axis1=-2, axis2=-1)
+    budget = 1.0 / num_assets
+    weights = 1.0 / np.sqrt(variances)
+    weights = weights / weights.sum(axis=-1, keepdims=True)
+
+    for _ in range(max_iter):
+        previous = weights.copy()
+        for i in range(num_assets):
+            var_i = variances[..., i]
+            cross = (cov[..., i, :] * weights).sum(axis=-1) - var_i * weights[..., i]
+            weights[..., i] = (-cross + np.sqrt(cross ** 2 + 4 * var_i * budget)) / (2 * var_i)
+        if np.abs(weights - previous).max() < tol * np.abs(weights).max():
+            break
+
+    return weights / weights.sum(axis=-1, keepdims=True)
+
+
+def optimize_weights(cov, method):
+    """
+    method에 따라 비중을 계산합니다.
+
+    Args:
+        cov (np.ndarray): (..., K, K) 공분산 행렬 배치.
+        method (str): WEIGHTINGS 중 하나.
+
+    Returns:
+        np.ndarray: (..., K) 비중.
+    """
+    if method == "equal":
+        num_assets = np.shape(cov)[-1]
+        return np.full(np.shape(cov)[:-1], 1.0 / num_assets)
+    if method == "min_variance":
+        return min_variance_weights(cov)
+    if method == "risk_parity":
+        return risk_parity_weights(cov)
+    raise ValueError(f"Unknown weighting: {method}")
@@ -1,33 +1,77 @@
 import sqlite3
 import pandas as pd
 
-# 데이터베이스 연결
-db_path = "krx_data.db"
-conn = sqlite3.connect(db_path)
-cursor = conn.cursor()
-
-# 테이블에서 데이터 읽기
-query = "SELECT Date, Ticker, Close FROM stock_monthly_data ORDER BY Ticker, Date"
-data = pd.read_sql(query, conn, parse_dates=["Date"])
-
-# ChangeRate 계산
-data['ChangeRate'] = data.groupby('Ticker')['Close'].pct_change() * 100
-data['ChangeRate'] = data['ChangeRate'].round(2)  # 소숫점 2자리로 반올림
-
-# 계산된 데이터를 테이블에 반영
-for index, row in data.iterrows():
-    date = row['Date'].strftime('%Y-%m-%d')
-    ticker = row['Ticker']
-    change_rate = row['ChangeRate']
-    
-    cursor.execute("""
+from krxquant.panel import to_panel
+
+# 기본 데이터베이스 경로
+DB_PATH = "data/krx_data.db"
+
+
+def connect(db_path=DB_PATH):
+    """데이터베이스 연결을 생성합니다."""
+    return sqlite3.connect(db_path)
+
+
+def load_data(conn, start_date, end_date):
+    """
+    데이터베이스에서 데이터를 로드하고 필터링합니다.
+
+    기간 조건을 SQL에서 적용하므로 이어서 실행할 때는 필요한 기간의 행만 읽습니다.
+
+    Args:
+        conn (sqlite3.Connection): 데이터베이스 연결.
+        start_date: 시작 날짜 (포함, 문자열 또는 Timestamp).
+        end_date: 종료 날짜 (포함, 문자열 또는 Timestamp).
+
+    Returns:
+        pd.DataFrame: Date 인덱스를 가진 종목 데이터.
+    """
+    # Date는 YYYY-MM-DD 텍스트로 저장되므로 같은 형식으로 맞춰 문자열 비교
+    query = """
+    SELECT * FROM stock_monthly_data
+    WHERE PER IS NOT NULL AND Date BETWEEN ? AND ?
+    ORDER BY Date, Ticker
+    """
+    params = (pd.Timestamp(start_date).strftime("%Y-%m-%d"), pd.Timestamp(end_date).strftime("%Y-%m-%d"))
+    data = pd.read_sql(query, conn, params=params, parse_dates=["Date"])
+    data.set_index("Date", inplace=True)
+
+    # 데이터 필터링
+    return data
+
+
+def load_panel(conn, start_date, end_date):
+    """load_data 결과를 메모리 효율적인 Panel로 로드합니다."""
+    return to_panel(load_data(conn, start_date, end_date))
+
+
+def update_change_rate(conn):
+    """
+    종가 기준 ChangeRate(%)를 다시 계산하여 테이블에 반영합니다.
+
+    Args:
+        conn (sqlite3.Connection): 데이터베이스 연결.
+
+    Returns:
+        int: 갱신된 행 수.
+    """
+    # 테이블에서 데이터 읽기
+    query = "SELECT Date, Ticker, Close FROM stock_monthly_data ORDER BY Ticker, Date"
+    data = pd.read_sql(query, conn, parse_dates=["Date"])
+
+    # ChangeRate 계산 (소숫점 2자리로 반올림)
+    change_rate = (data.groupby("Ticker")["Close"].pct_change() * 100).round(2)
+
+    # 계산된 데이터를 테이블에 반영
+    updates = zip(
+        change_rate.tolist(),
+        data["Date"].dt.strftime("%Y-%m-%d").tolist(),
+        data["Ticker"].tolist(),
+    )
+    conn.executemany("""
         UPDATE stock_monthly_data
         SET ChangeRate = ?
         WHERE Date = ? AND Ticker = ?
-    """, (change_rate, date, ticker))
-
-# 변경사항 저장 및 연결 종료
-conn.commit()
-conn.close()
-
-print("ChangeRate 계산 및 업데이트 완료!")
\ No newline at end of file
+    """, updates)
+    conn.commit()
+    return len(data)
@@ -0,0 +1,286 @@
+"""
+로컬 데이터 서비스.
+
+한 프로세스(`python -m krxquant serve`)가 DB를 한 번만 로드하여 Panel 배열을 공유 메모리 블록에
+올리고, 로컬 소켓으로 요청을 받습니다. 클라이언트는
+
+- attach(): 공유 메모리 블록을 복사 없이 매핑하여 Panel로 사용하거나
+- range() / cross_section(): 소켓을 통해 필요한 구간만 DataFrame으로 받을 수 있습니다.
+
+보안: 연결은 사용자별 인증 키(~/.krxquant/authkey, 권한 0600)로 핸드셰이크합니다. 키는 서버를 처음
+실행할 때 무작위로 생성되며, 환경 변수 KRXQUANT_AUTHKEY로 덮어쓸 수 있습니다. 서버는 요청을 JSON으로만
+해석하고 unpickle하지 않지만, 응답(DataFrame, manifest)은 pickle로 전송되어 클라이언트가 unpickle하므로
+키를 가진 사용자는 서로의 프로세스를 신뢰할 수 있어야 합니다. 키 파일을 다른 사용자와 공유하지 마세요.
+"""
+import json
+import logging
+import os
+import secrets
+import threading
+from multiprocessing import AuthenticationError, resource_tracker, shared_memory
+from multiprocessing.connection import Client, Listener
+
+import numpy as np
+import pandas as pd
+
+from krxquant.panel import Panel, from_panel
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ADDRESS = ("127.0.0.1", 6210)
+AUTHKEY_PATH = os.path.join(os.path.expanduser("~"), ".krxquant", "authkey")
+
+# 배열 시작 위치를 캐시 라인 단위로 정렬
+_ALIGN = 64
+
+
+def parse_address(text):
+    """'host:port' 문자열을 (host, port) 튜플로 변환"""
+    host, _, port = text.rpartition(":")
+    return (host or DEFAULT_ADDRESS[0], int(port))
+
+
+def load_authkey(create=False, path=None):
+    """
+    데이터 서비스 인증 키를 읽습니다.
+
+    환경 변수 KRXQUANT_AUTHKEY가 있으면 그 값을, 없으면 path의 키 파일을 사용합니다.
+
+    Args:
+        create (bool): 키 파일이 없으면 무작위 키를 생성하여 권한 0600으로 저장 (서버용).
+        path (str): 키 파일 경로 (기본 AUTHKEY_PATH).
+
+    Returns:
+        bytes: 인증 키. 키 파일이 없고 create가 False이면 None.
+    """
+    if os.environ.get("KRXQUANT_AUTHKEY"):
+        return os.environ["KRXQUANT_AUTHKEY"].encode()
+    path = path or AUTHKEY_PATH
+    try:
+        with open(path, "rb") as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        if not create:
+            return None
+
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    key = secrets.token_hex(32).encode()
+    try:
+        # O_EXCL: 동시에 실행된 다른 서버가 먼저 만든 키를 덮어쓰지 않음
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        return load_authkey(path=path)
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    logger.info(f"Created data service authkey: {path}")
+    return key
+
+
+def _panel_arrays(panel):
+    """공유 메모리에 올릴 Panel 배열 (object 타입은 고정 길이 문자열로 변환)"""
+    arrays = {
+        "dates": panel.dates,
+        "tickers": panel.tickers,
+        # 결측 종목명(None, NaN)은 "nan" 문자열이 되지 않도록 빈 문자열로 저장
+        "names": np.array(["" if pd.isna(name) else name for name in panel.names], dtype=str),
+        "date_code": panel.date_code,
+        "ticker_code": panel.ticker_code,
+        "flags": panel.flags,
+    }
+    for col, values in panel.columns.items():
+        arrays[f"col:{col}"] = values.astype(str) if values.dtype == object else values
+    return arrays
+
+
+def _views(shm, manifest):
+    """공유 메모리 블록 위의 배열 뷰 (복사 없음)"""
+    return {
+        key: np.ndarray(spec["shape"], dtype=spec["dtype"], buffer=shm.buf, offset=spec["offset"])
+        for key, spec in manifest["layout"].items()
+    }
+
+
+def _panel_from_shm(shm, manifest):
+    views = _views(shm, manifest)
+    # 종목명은 종목 수만큼만 복사하여 빈 문자열을 결측(None)으로 복원
+    names = views["names"].astype(object)
+    names[names == ""] = None
+    panel = Panel(
+        views["dates"], views["tickers"], names, views["date_code"], views["ticker_code"],
+        {col: views[f"col:{col}"] for col in manifest["columns"]},
+        flags=views["flags"], flag_names=manifest["flag_names"], column_order=manifest["column_order"],
+    )
+    panel.base = shm  # 매핑이 Panel보다 먼저 해제되지 않도록 유지
+    return panel
+
+
+def share_panel(panel):
+    """
+    Panel 배열을 하나의 공유 메모리 블록에 복사합니다.
+
+    Args:
+        panel (Panel): 공유할 패널 데이터.
+
+    Returns:
+        tuple: (SharedMemory, manifest). manifest는 클라이언트가 블록을 해석하는 데 필요한 정보.
+    """
+    arrays = _panel_arrays(panel)
+    layout, offset = {}, 0
+    for key, array in arrays.items():
+        layout[key] = {"dtype": array.dtype.str, "shape": array.shape, "offset": offset}
+        offset += -(-array.nbytes // _ALIGN) * _ALIGN
+
+    shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    manifest = {
+        "shm": shm.name,
+        "layout": layout,
+        "columns": list(panel.columns),
+        "flag_names": list(panel.flag_names),
+        "column_order": list(panel.column_order),
+    }
+    for key, view in _views(shm, manifest).items():
+        view[...] = arrays[key]
+    return shm, manifest
+
+
+def attach_panel(manifest):
+    """manifest가 가리키는 공유 메모리 블록을 복사 없이 Panel로 매핑합니다."""
+    try:
+        shm = shared_memory.SharedMemory(name=manifest["shm"], track=False)
+    except TypeError:
+        # Python 3.12 이하: 클라이언트 종료 시 resource_tracker가 블록을 지우지 않도록 등록 해제
+        shm = shared_memory.SharedMemory(name=manifest["shm"])
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return _panel_from_shm(shm, manifest)
+
+
+class DataServer:
+    """
+    Panel을 공유 메모리에 올리고 로컬 소켓으로 조회 요청을 처리하는 서버.
+
+    요청은 [op, *args] JSON 배열(인자는 문자열)이며, 서버는 요청을 unpickle하지 않습니다.
+    응답은 pickle로 전송되는 ("ok", payload) 또는 ("error", message) 튜플입니다.
+
+    - ("manifest",): 공유 메모리 manifest
+    - ("range", start_date, end_date): 기간 데이터 DataFrame
+    - ("cross_section", date): 특정 날짜 횡단면 DataFrame
+    """
+
+    def __init__(self, panel, address=DEFAULT_ADDRESS, authkey=None):
+        authkey = authkey or load_authkey(create=True)
+        self.shm, self.manifest = share_panel(panel)
+        self.panel = _panel_from_shm(self.shm, self.manifest)
+        self.listener = Listener(address, authkey=authkey)
+
+    @property
+    def address(self):
+        return self.listener.address
+
+    def serve_forever(self):
+        """클라이언트 연결마다 스레드를 띄워 요청을 처리합니다."""
+        try:
+            while True:
+                try:
+                    conn = self.listener.accept()
+                except (AuthenticationError, EOFError, ConnectionError) as e:
+                    # 키가 다르거나 핸드셰이크 중 끊긴 클라이언트 때문에 서비스가 종료되지 않도록 연결만 거부
+                    logger.warning(f"Rejected data service connection: {e}")
+                    continue
+                threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+        finally:
+            self.close()
+
+    def _handle(self, conn):
+        with conn:
+            while True:
+                try:
+                    message = conn.recv_bytes()
+                except (EOFError, OSError):
+                    break
+                try:
+                    request = json.loads(message)
+                    response = ("ok", self._dispatch(*request))
+                except Exception as e:
+                    logger.warning(f"Failed to handle request {message[:200]!r}: {e}")
+                    response = ("error", str(e))
+                conn.send(response)
+
+    def _dispatch(self, op, *args):
+        if op == "manifest":
+            return self.manifest
+        if op == "range":
+            start_date, end_date = args
+            return from_panel(self.panel, self.panel.date_range_slice(start_date, end_date))
+        if op == "cross_section":
+            (date,) = args
+            return self.panel.cross_section(self.panel.date_position(date))
+        raise ValueError(f"Unknown request: {op}")
+
+    def close(self):
+        """리스너를 닫고 공유 메모리 블록을 해제합니다. 여러 번 호출해도 안전합니다."""
+        if self.shm is None:
+            return
+        self.listener.close()
+        self.panel = None
+        self.shm.unlink()
+        try:
+            self.shm.close()
+        except BufferError:
+            pass  # 처리 중인 요청이 뷰를 참조하고 있으면 프로세스 종료 시 해제
+        self.shm = None
+
+
+class DataClient:
+    """DataServer 클라이언트."""
+
+    def __init__(self, address=DEFAULT_ADDRESS, authkey=None):
+        authkey = authkey or load_authkey()
+        if authkey is None:
+            raise FileNotFoundError("Data service authkey not found (start `krxquant serve` first)")
+        self.conn = Client(address, authkey=authkey)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def _request(self, op, *args):
+        # 날짜 등 인자는 문자열로 보내고 서버에서 pd.Timestamp로 해석
+        self.conn.send_bytes(json.dumps([op, *map(str, args)]).encode())
+        status, payload = self.conn.recv()
+        if status == "error":
+            raise RuntimeError(f"Data service error: {payload}")
+        return payload
+
+    def manifest(self):
+        return self._request("manifest")
+
+    def attach(self):
+        """서버의 공유 메모리 Panel을 복사 없이 매핑합니다."""
+        return attach_panel(self.manifest())
+
+    def range(self, start_date, end_date):
+        """start_date ~ end_date 기간 데이터를 load_data 형태의 DataFrame으로 조회"""
+        return self._request("range", start_date, end_date)
+
+    def cross_section(self, date):
+        """특정 날짜 횡단면을 DataFrame으로 조회"""
+        return self._request("cross_section", date)
+
+
+def connect_service(address=DEFAULT_ADDRESS, authkey=None):
+    """
+    데이터 서비스에 연결합니다.
+
+    서비스가 실행 중이 아니거나 인증 키가 없거나 맞지 않으면(다른 KRXQUANT_AUTHKEY로 실행된 서비스 등)
+    None을 반환합니다.
+    """
+    try:
+        return DataClient(address, authkey)
+    except (OSError, AuthenticationError) as e:
+        logger.info(f"Data service unavailable at {address}: {e}")
+        return None
@@ -104,4 +104,12 @@ def quality_value_strategy(data):
     data['Rank'] = data.groupby('Date')['Combined_Score'].rank(ascending=True, na_option='bottom')
     top_30_percent = data[data['Rank'] <= len(data) * 0.3]
     
-    return top_30_percent
\ No newline at end of file
+    return top_30_percent
+
+
+# CLI 및 스윕에서 이름으로 전략을 선택하기 위한 레지스트리
+STRATEGIES = {
+    "low_per": low_per_strategy,
+    "low_per_high_div": low_per_high_div_strategy,
+    "small_value": small_value_strategy,
+}
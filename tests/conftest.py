@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 저장소 루트를 모듈 경로에 추가 (krxquant 패키지 import)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
@@ -1,9 +1,11 @@
 import sqlite3
-from pykrx import stock
 from datetime import datetime
 import pandas as pd
 
 def fetch_and_save_sector_data(db_path="krx_data.db"):
+    # pykrx는 실행 시에만 로드 (pytest 수집 시 import 가능하도록)
+    from pykrx import stock
+
     # 데이터베이스 연결
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
@@ -44,4 +46,6 @@ def fetch_and_save_sector_data(db_path="krx_data.db"):
     print("Sector data saved to database.")
 
 # 실행
-fetch_and_save_sector_data()
+if __name__ == "__main__":
+    fetch_and_save_sector_data()
+
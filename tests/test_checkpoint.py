@@ -0,0 +1,212 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from krxquant.backtest import run_backtest
+from krxquant.checkpoint import load_checkpoint, resume_start, save_checkpoint, validate_checkpoint
+from krxquant.cli import main
+from krxquant.panel import to_panel
+from krxquant.query import load_data
+from krxquant.strategies import STRATEGIES
+
+START_DATE = "2018-01-01"
+CHECKPOINT_DATE = "2021-06-30"
+END_DATE = "2022-12-31"
+STRATEGY_KWARGS = {"max_stocks": 8}
+
+
+def make_data(num_tickers=40, seed=0):
+    """load_data 형태의 합성 월별 데이터"""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(START_DATE, END_DATE, freq="ME")
+    # 공통 요인이 있는 월 수익률로 종목 간 상관을 만듦
+    market = rng.normal(0.005, 0.04, len(dates))
+    returns = market[:, None] * rng.uniform(0.5, 1.5, num_tickers) + rng.normal(0, 0.06, (len(dates), num_tickers))
+    close = 10000 * np.cumprod(1 + returns, axis=0)
+
+    frames = []
+    for i, date in enumerate(dates):
+        eps = rng.uniform(100, 2000, num_tickers)
+        bps = rng.uniform(5000, 40000, num_tickers)
+        frames.append(pd.DataFrame({
+            "Date": date,
+            "Ticker": [f"{code:06d}" for code in range(num_tickers)],
+            "Name": [f"종목{code}" for code in range(num_tickers)],
+            "Close": close[i],
+            "ChangeRate": np.round(returns[i] * 100, 2),
+            "PER": close[i] / eps,
+            "BPS": bps,
+            "PBR": close[i] / bps,
+            "EPS": eps,
+            "DIV": rng.uniform(0, 6, num_tickers),
+            "MarketCap": close[i] * rng.uniform(1e6, 1e8, num_tickers),
+        }))
+    return pd.concat(frames).set_index("Date")
+
+
+def resume_panel(panel, checkpoint, weighting, end_date=END_DATE):
+    """CLI의 --resume과 같이 체크포인트 이후(최적화 비중이면 공분산 기간 포함)만 선택"""
+    return panel.select_dates(resume_start(checkpoint["dates"][-1], checkpoint["start_date"], weighting), end_date)
+
+
+def save_partial(tmp_path, panel, strategy, weighting):
+    partial = panel.select_dates(START_DATE, CHECKPOINT_DATE)
+    result = run_backtest(partial, STRATEGIES[strategy], 10_000_000, **weighting, **STRATEGY_KWARGS)
+    path = str(tmp_path / "checkpoint.json")
+    save_checkpoint(path, result, partial, strategy, STRATEGY_KWARGS, 10_000_000, START_DATE, weighting)
+    return load_checkpoint(path)
+
+
+@pytest.mark.parametrize("weighting", [
+    {"weighting": "equal"},
+    {"weighting": "min_variance", "cov_window": 12},
+    {"weighting": "risk_parity", "cov_window": 12},
+])
+def test_resume_matches_full_run(tmp_path, weighting):
+    panel = to_panel(make_data())
+    full = run_backtest(panel, STRATEGIES["low_per"], 10_000_000, **weighting, **STRATEGY_KWARGS)
+
+    checkpoint = save_partial(tmp_path, panel, "low_per", weighting)
+    data = resume_panel(panel, checkpoint, weighting)
+    validate_checkpoint(checkpoint, data, "low_per", STRATEGY_KWARGS, weighting)
+    resumed = run_backtest(data, STRATEGIES["low_per"], checkpoint["initial_cash"], state=checkpoint,
+                           **weighting, **STRATEGY_KWARGS)
+
+    assert resumed["portfolio_values"] == full["portfolio_values"]
+    assert resumed["monthly_returns"] == full["monthly_returns"]
+    assert resumed["dates"] == full["dates"]
+    assert resumed["holdings"] == full["holdings"]
+    assert resumed["cash"] == full["cash"]
+
+
+def test_rejects_different_strategy(tmp_path):
+    weighting = {"weighting": "equal"}
+    panel = to_panel(make_data())
+    checkpoint = save_partial(tmp_path, panel, "low_per", weighting)
+    data = resume_panel(panel, checkpoint, weighting)
+
+    with pytest.raises(ValueError, match="Checkpoint was created with low_per"):
+        validate_checkpoint(checkpoint, data, "small_value", STRATEGY_KWARGS, weighting)
+    with pytest.raises(ValueError, match="Checkpoint was created with low_per"):
+        validate_checkpoint(checkpoint, data, "low_per", {"max_stocks": 10}, weighting)
+    with pytest.raises(ValueError, match="weighting"):
+        validate_checkpoint(checkpoint, data, "low_per", STRATEGY_KWARGS, {"weighting": "risk_parity", "cov_window": 12})
+
+
+def test_rejects_changed_checkpoint_date_data(tmp_path):
+    weighting = {"weighting": "equal"}
+    checkpoint = save_partial(tmp_path, to_panel(make_data()), "low_per", weighting)
+
+    changed = make_data()
+    changed.loc[pd.Timestamp(CHECKPOINT_DATE), "Close"] *= 1.01
+    with pytest.raises(ValueError, match="changed since the checkpoint"):
+        validate_checkpoint(checkpoint, resume_panel(to_panel(changed), checkpoint, weighting), "low_per",
+                            STRATEGY_KWARGS, weighting)
+
+
+def test_rejects_missing_checkpoint_date(tmp_path):
+    weighting = {"weighting": "equal"}
+    checkpoint = save_partial(tmp_path, to_panel(make_data()), "low_per", weighting)
+
+    data = make_data()
+    data = data[data.index != pd.Timestamp(CHECKPOINT_DATE)]
+    with pytest.raises(ValueError, match="missing from the data"):
+        validate_checkpoint(checkpoint, resume_panel(to_panel(data), checkpoint, weighting), "low_per",
+                            STRATEGY_KWARGS, weighting)
+
+
+def test_rejects_changed_covariance_history(tmp_path):
+    weighting = {"weighting": "min_variance", "cov_window": 12}
+    checkpoint = save_partial(tmp_path, to_panel(make_data()), "low_per", weighting)
+
+    # 체크포인트 날짜 이전, 공분산 기간 안의 ChangeRate만 변경
+    changed = make_data()
+    window = (changed.index >= "2020-09-30") & (changed.index <= "2021-03-31")
+    changed.loc[window, "ChangeRate"] *= 3
+    with pytest.raises(ValueError, match="ChangeRate for 2020-06-30 ~ 2021-06-30 changed"):
+        validate_checkpoint(checkpoint, resume_panel(to_panel(changed), checkpoint, weighting), "low_per",
+                            STRATEGY_KWARGS, weighting)
+
+    # 공분산 기간보다 이전의 변경은 이어서 실행 결과에 영향이 없으므로 허용
+    earlier = make_data()
+    earlier.loc[earlier.index <= "2019-12-31", "ChangeRate"] *= 3
+    validate_checkpoint(checkpoint, resume_panel(to_panel(earlier), checkpoint, weighting), "low_per",
+                        STRATEGY_KWARGS, weighting)
+
+    # 공분산 기록이 없는 (이전 버전) 체크포인트는 거부
+    del checkpoint["history_version"]
+    with pytest.raises(ValueError, match="does not record ChangeRate history"):
+        validate_checkpoint(checkpoint, resume_panel(to_panel(make_data()), checkpoint, weighting), "low_per",
+                            STRATEGY_KWARGS, weighting)
+
+
+def make_db(path):
+    """make_data를 stock_monthly_data 테이블(Date는 YYYY-MM-DD 텍스트)로 저장"""
+    data = make_data().reset_index()
+    data["Date"] = data["Date"].dt.strftime("%Y-%m-%d")
+    conn = sqlite3.connect(path)
+    data.to_sql("stock_monthly_data", conn, index=False)
+    conn.close()
+
+
+def test_load_data_filters_dates_in_sql(tmp_path):
+    make_db(tmp_path / "krx.db")
+    conn = sqlite3.connect(tmp_path / "krx.db")
+    try:
+        data = load_data(conn, pd.Timestamp("2021-06-30"), "2021-08-31")
+    finally:
+        conn.close()
+
+    assert sorted(set(data.index.strftime("%Y-%m-%d"))) == ["2021-06-30", "2021-07-31", "2021-08-31"]
+
+
+@pytest.mark.parametrize("weighting", ["equal", "min_variance"])
+def test_cli_resume_reads_only_new_rows(tmp_path, monkeypatch, capsys, weighting):
+    db_path, checkpoint_path = str(tmp_path / "krx.db"), str(tmp_path / "checkpoint.json")
+    make_db(db_path)
+    common = ["--db", db_path, "--log-dir", str(tmp_path / "logs"), "--strategy", "low_per",
+              "--weighting", weighting, "--cov-window", "12", "--checkpoint", checkpoint_path]
+    main(["backtest", *common, "--start", START_DATE, "--end", CHECKPOINT_DATE])
+
+    # SQLite에서 실제로 읽은 행의 날짜를 기록
+    read_sql = pd.read_sql
+    loaded = []
+
+    def recording_read_sql(*args, **kwargs):
+        frame = read_sql(*args, **kwargs)
+        loaded.append(frame["Date"])
+        return frame
+
+    monkeypatch.setattr(pd, "read_sql", recording_read_sql)
+    capsys.readouterr()
+    main(["backtest", *common, "--end", END_DATE, "--resume"])
+    resumed = capsys.readouterr().out
+
+    checkpoint = load_checkpoint(checkpoint_path)
+    expected_start = resume_start(CHECKPOINT_DATE, START_DATE, {"weighting": weighting, "cov_window": 12})
+    assert len(loaded) == 1
+    assert loaded[0].min() == expected_start
+    assert loaded[0].max() == pd.Timestamp(END_DATE)
+
+    # 전체 재실행과 같은 결과
+    monkeypatch.setattr(pd, "read_sql", read_sql)
+    main(["backtest", *common[:-2], "--start", START_DATE, "--end", END_DATE])
+    assert capsys.readouterr().out == resumed
+    assert checkpoint["dates"][-1] == pd.Timestamp(END_DATE)
+
+
+def test_cli_resume_reports_unreadable_checkpoint(tmp_path, capsys):
+    args = ["backtest", "--db", str(tmp_path / "krx.db"), "--log-dir", str(tmp_path / "logs"), "--resume"]
+    with pytest.raises(SystemExit) as exc:
+        main([*args, "--checkpoint", str(tmp_path / "missing.json")])
+    assert exc.value.code == 1
+    assert "Cannot resume from" in capsys.readouterr().err
+
+    broken = tmp_path / "broken.json"
+    broken.write_text("{not json", encoding="utf-8")
+    with pytest.raises(SystemExit) as exc:
+        main([*args, "--checkpoint", str(broken)])
+    assert exc.value.code == 1
+    assert "Cannot resume from" in capsys.readouterr().err
@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# import 시점에 로드되면 안 되는 무거운/선택 의존성
+HEAVY_MODULES = ("matplotlib", "tabulate", "pykrx", "PyQt5")
+
+
+def test_library_modules_import_without_side_effects(tmp_path):
+    code = (
+        "import sys\n"
+        "import krxquant.cli, krxquant.backtest, krxquant.query, krxquant.ingest\n"
+        f"loaded = [name for name in {HEAVY_MODULES!r} if name in sys.modules]\n"
+        "print(','.join(loaded))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(ROOT))
+    result = subprocess.run([sys.executable, "-c", code], cwd=tmp_path, env=env,
+                            capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == ""
+    # 기본 DB(data/krx_data.db)나 logs/ 디렉터리가 만들어지지 않아야 함
+    assert os.listdir(tmp_path) == []
+
+
+def test_cli_help_does_not_load_dependencies(tmp_path):
+    code = (
+        "import sys\n"
+        "from krxquant.cli import build_parser\n"
+        "build_parser().format_help()\n"
+        "print(','.join(name for name in ('numpy', 'pandas', *"
+        f"{HEAVY_MODULES!r}) if name in sys.modules))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(ROOT))
+    result = subprocess.run([sys.executable, "-c", code], cwd=tmp_path, env=env,
+                            capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == ""
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from krxquant.panel import FLOAT32_COLUMNS, from_panel, to_panel
+
+
+def make_frame():
+    """load_data 형태의 DataFrame (Date 인덱스, Ticker/Name, 가격·펀더멘털, bool 컬럼)"""
+    rows = [
+        ("2024-02-29", "000660", "SK하이닉스", 160000.0, 1.5e6, 1.23456789, 0.87654321, -2.5, False, True),
+        ("2024-01-31", "005930", "삼성전자", 74000.0, 2.0e7, 12.3456789, 1.15, 3.25, True, False),
+        ("2024-01-31", "000660", "SK하이닉스", 142000.0, 3.0e6, np.nan, 1.9, 0.0, False, False),
+        ("2024-02-29", "005930", "삼성전자", 73000.0, 1.8e7, 11.99, 1.1, -1.35, True, True),
+        ("2024-02-29", "035720", None, 52000.0, 9.0e5, 45.6789, 2.2, 7.1, False, True),
+    ]
+    frame = pd.DataFrame(rows, columns=[
+        "Date", "Ticker", "Name", "Close", "Volume", "PER", "PBR", "ChangeRate", "Halted", "Preferred",
+    ])
+    frame["Date"] = pd.to_datetime(frame["Date"])
+    return frame.set_index("Date")
+
+
+def test_round_trip():
+    data = make_frame()
+    panel = to_panel(data)
+    restored = from_panel(panel)
+
+    # (날짜, 종목) 순 정렬 외에는 원본과 같아야 함
+    expected = data.reset_index().sort_values(["Date", "Ticker"]).set_index("Date")
+    assert list(restored.columns) == list(data.columns)
+    assert restored.index.name == "Date"
+    # 날짜는 datetime64[ns]로 보관 (pandas 버전에 따라 원본 해상도는 다를 수 있음)
+    assert restored.index.equals(expected.index)
+    assert restored["Ticker"].tolist() == expected["Ticker"].tolist()
+
+    # 가격·거래량은 원래 타입 그대로, 펀더멘털은 float32 정밀도 내에서 복원
+    for col in ("Close", "Volume"):
+        assert panel.columns[col].dtype == np.float64
+        np.testing.assert_array_equal(restored[col].to_numpy(), expected[col].to_numpy())
+    for col in ("PER", "PBR", "ChangeRate"):
+        assert col in FLOAT32_COLUMNS
+        assert panel.columns[col].dtype == np.float32
+        assert restored[col].dtype == np.float64
+        np.testing.assert_allclose(restored[col].to_numpy(), expected[col].to_numpy(), rtol=1e-6)
+
+
+def test_bool_columns_are_bit_packed():
+    data = make_frame()
+    panel = to_panel(data)
+    expected = data.reset_index().sort_values(["Date", "Ticker"])
+
+    assert panel.flag_names == ("Halted", "Preferred")
+    assert panel.flags.dtype == np.uint8
+    assert "Halted" not in panel.columns and "Preferred" not in panel.columns
+    np.testing.assert_array_equal(panel.flags, expected["Halted"].to_numpy() | expected["Preferred"].to_numpy() << 1)
+
+    restored = from_panel(panel)
+    for col in ("Halted", "Preferred"):
+        assert restored[col].dtype == bool
+        np.testing.assert_array_equal(panel.flag(col), expected[col].to_numpy())
+        assert restored[col].tolist() == expected[col].tolist()
+
+
+def test_names_are_stored_per_ticker():
+    data = make_frame()
+    panel = to_panel(data)
+
+    assert len(panel.names) == len(panel.tickers) == 3
+    restored = from_panel(panel)
+    names = dict(zip(restored["Ticker"], restored["Name"]))
+    assert pd.isna(names.pop("035720"))
+    assert names == {"000660": "SK하이닉스", "005930": "삼성전자"}
+    # 횡단면 복원에서도 행마다 종목명이 채워짐
+    cross_section = panel.cross_section(panel.date_position("2024-01-31"))
+    assert cross_section["Name"].tolist() == ["SK하이닉스", "삼성전자"]
+
+
+def test_cross_section_and_value():
+    panel = to_panel(make_frame())
+    date_idx = panel.date_position("2024-02-29")
+
+    assert panel.cross_section(date_idx)["Ticker"].tolist() == ["000660", "005930", "035720"]
+    assert panel.value(date_idx, "Close", "005930") == 73000.0
+    with pytest.raises(KeyError):
+        panel.value(panel.date_position("2024-01-31"), "Close", "035720")
+    with pytest.raises(KeyError):
+        panel.date_position("2024-03-31")
+
+
+def test_empty_frame():
+    data = make_frame().iloc[:0]
+    panel = to_panel(data)
+
+    assert len(panel) == 0
+    assert len(panel.dates) == 0 and len(panel.tickers) == 0
+    restored = from_panel(panel)
+    assert restored.empty
+    assert list(restored.columns) == list(data.columns)
+    assert restored.index.name == "Date"
@@ -0,0 +1,81 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from krxquant.portfolio import RollingCovariance, min_variance_weights, optimize_weights, risk_parity_weights
+
+
+def random_covariance(rng, num_assets):
+    """무작위 상관행렬과 변동성으로 만든 공분산 (음수 비중이 자주 나오는 강한 상관 포함)"""
+    factors = rng.normal(size=(num_assets, num_assets))
+    cov = factors @ factors.T + 0.1 * np.eye(num_assets)
+    std = np.sqrt(np.diagonal(cov))
+    volatility = rng.uniform(0.1, 0.5, num_assets)
+    return cov / np.outer(std, std) * np.outer(volatility, volatility)
+
+
+def exact_long_only_min_variance(cov):
+    """모든 종목 부분집합을 열거하여 구한 공매도 금지 최소분산 (비교 기준)"""
+    num_assets = len(cov)
+    best = np.inf
+    for size in range(1, num_assets + 1):
+        for subset in combinations(range(num_assets), size):
+            subset = list(subset)
+            inverse_ones = np.linalg.solve(cov[np.ix_(subset, subset)], np.ones(size))
+            weights = inverse_ones / inverse_ones.sum()
+            if (weights >= 0).all():
+                best = min(best, weights @ cov[np.ix_(subset, subset)] @ weights)
+    return best
+
+
+@pytest.mark.parametrize("num_assets", range(3, 9))
+def test_min_variance_matches_exact_optimum(num_assets):
+    rng = np.random.default_rng(num_assets)
+    for _ in range(50):
+        cov = random_covariance(rng, num_assets)
+        weights = min_variance_weights(cov)
+
+        assert weights.sum() == pytest.approx(1.0)
+        assert (weights >= 0).all()
+        assert weights @ cov @ weights == pytest.approx(exact_long_only_min_variance(cov), rel=1e-9)
+
+
+def test_min_variance_batch_and_unconstrained():
+    rng = np.random.default_rng(42)
+    batch = np.stack([random_covariance(rng, 5) for _ in range(6)]).reshape(2, 3, 5, 5)
+
+    weights = min_variance_weights(batch)
+    assert weights.shape == (2, 3, 5)
+    np.testing.assert_allclose(weights[1, 2], min_variance_weights(batch[1, 2]))
+
+    # 공매도 허용 시 Σ^-1 1 / 1'Σ^-1 1
+    inverse_ones = np.linalg.solve(batch[0, 0], np.ones(5))
+    np.testing.assert_allclose(min_variance_weights(batch[0, 0], long_only=False), inverse_ones / inverse_ones.sum())
+
+
+def test_risk_parity_equalizes_risk_contributions():
+    cov = random_covariance(np.random.default_rng(7), 6)
+    weights = risk_parity_weights(cov)
+
+    contributions = weights * (cov @ weights)
+    assert weights.sum() == pytest.approx(1.0)
+    np.testing.assert_allclose(contributions, contributions.mean(), rtol=1e-6)
+
+
+def test_optimize_weights_equal_and_unknown():
+    np.testing.assert_allclose(optimize_weights(np.eye(4), "equal"), np.full(4, 0.25))
+    with pytest.raises(ValueError):
+        optimize_weights(np.eye(4), "max_sharpe")
+
+
+def test_rolling_covariance_window():
+    rng = np.random.default_rng(3)
+    returns = rng.normal(size=(30, 4))
+    covariance = RollingCovariance(num_assets=6, window=12, min_periods=2, shrinkage=0.0)
+    codes = np.array([0, 2, 3, 5])
+    for month in returns:
+        covariance.update(codes, month)
+
+    # 최근 window개월만으로 계산한 표본 공분산과 같아야 함
+    np.testing.assert_allclose(covariance.covariance(codes), np.cov(returns[-12:], rowvar=False))
@@ -0,0 +1,113 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from krxquant import service
+from krxquant.panel import from_panel, to_panel
+from krxquant.service import DataClient, DataServer, attach_panel, connect_service, share_panel
+
+AUTHKEY = b"test-authkey"
+
+
+def make_frame():
+    """종목명 결측과 bool 컬럼을 포함한 load_data 형태의 DataFrame"""
+    rows = [
+        ("2024-01-31", "000660", "SK하이닉스", 142000.0, 3.0e6, 8.5, 1.9, 0.0, False),
+        ("2024-01-31", "005930", "삼성전자", 74000.0, 2.0e7, 12.3, 1.15, 3.25, True),
+        ("2024-02-29", "000660", "SK하이닉스", 160000.0, 1.5e6, np.nan, 0.87, -2.5, False),
+        ("2024-02-29", "005930", "삼성전자", 73000.0, 1.8e7, 11.99, 1.1, -1.35, True),
+        ("2024-02-29", "035720", None, 52000.0, 9.0e5, 45.6, 2.2, 7.1, False),
+    ]
+    frame = pd.DataFrame(rows, columns=["Date", "Ticker", "Name", "Close", "Volume", "PER", "PBR", "ChangeRate",
+                                        "Halted"])
+    frame["Date"] = pd.to_datetime(frame["Date"])
+    return frame.set_index("Date")
+
+
+@pytest.fixture
+def server():
+    server = DataServer(to_panel(make_frame()), ("127.0.0.1", 0), authkey=AUTHKEY)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.close()
+
+
+def test_share_and_attach_round_trip():
+    panel = to_panel(make_frame())
+    shm, manifest = share_panel(panel)
+    try:
+        # 배열은 캐시 라인 단위로 정렬
+        assert all(spec["offset"] % 64 == 0 for spec in manifest["layout"].values())
+
+        attached = attach_panel(manifest)
+        assert attached.base is not None
+        assert attached.flag_names == ("Halted",)
+        pd.testing.assert_frame_equal(from_panel(attached), from_panel(panel))
+
+        names = from_panel(attached)["Name"].tolist()
+        assert names[:4] == ["SK하이닉스", "삼성전자", "SK하이닉스", "삼성전자"]
+        assert pd.isna(names[4])  # "nan" 문자열이 아닌 결측
+        del attached
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_server_requests(server):
+    with DataClient(server.address, AUTHKEY) as client:
+        data = client.range("2024-02-01", "2024-02-29")
+        assert data["Ticker"].tolist() == ["000660", "005930", "035720"]
+        assert data["Halted"].tolist() == [False, True, False]
+
+        cross_section = client.cross_section(pd.Timestamp("2024-01-31"))
+        assert cross_section["Close"].tolist() == [142000.0, 74000.0]
+
+        with pytest.raises(RuntimeError, match="Data service error"):
+            client.cross_section("2024-03-31")
+        # 오류 후에도 같은 연결로 계속 요청 가능
+        assert len(client.range("2024-01-01", "2024-12-31")) == 5
+
+
+def test_server_rejects_unknown_request(server):
+    with DataClient(server.address, AUTHKEY) as client:
+        with pytest.raises(RuntimeError, match="Unknown request"):
+            client._request("shutdown")
+
+
+def test_attach_from_server(server):
+    with DataClient(server.address, AUTHKEY) as client:
+        panel = client.attach()
+    pd.testing.assert_frame_equal(from_panel(panel), from_panel(server.panel))
+    del panel
+
+
+def test_connect_service_wrong_or_missing_key(server, tmp_path, monkeypatch):
+    assert connect_service(server.address, b"wrong-key") is None
+    # 키가 틀린 연결을 거부한 뒤에도 서비스는 계속 동작
+    with DataClient(server.address, AUTHKEY) as client:
+        assert len(client.range("2024-01-01", "2024-12-31")) == 5
+
+    # 환경 변수도 키 파일도 없으면 연결하지 않음
+    monkeypatch.delenv("KRXQUANT_AUTHKEY", raising=False)
+    monkeypatch.setattr(service, "AUTHKEY_PATH", str(tmp_path / "authkey"))
+    assert connect_service(server.address) is None
+
+    client = connect_service(server.address, AUTHKEY)
+    assert client is not None
+    client.close()
+
+
+def test_load_authkey_creates_private_key(tmp_path, monkeypatch):
+    monkeypatch.delenv("KRXQUANT_AUTHKEY", raising=False)
+    path = tmp_path / "krxquant" / "authkey"
+
+    assert service.load_authkey(path=str(path)) is None
+    key = service.load_authkey(create=True, path=str(path))
+    assert len(key) == 64
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert service.load_authkey(path=str(path)) == key
+
+    monkeypatch.setenv("KRXQUANT_AUTHKEY", "from-env")
+    assert service.load_authkey(path=str(path)) == b"from-env"
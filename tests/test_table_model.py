@@ -0,0 +1,103 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+from PyQt5.QtCore import Qt  # noqa: E402
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+from table_model import ArrayTableModel  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def model(app):
+    model = ArrayTableModel()
+    model.set_columns({
+        "Date": np.array(["2024-01-31", "NaT", "2024-03-31", "2024-02-29", "2024-01-31"], dtype="datetime64[ns]"),
+        "Ticker": np.array(["005930", "000660", "035720", "005380", "051910"], dtype=object),
+        "Name": np.array(["삼성전자", None, "Kakao", np.nan, "LG화학"], dtype=object),
+        "PER": np.array([12.5, np.nan, 45.0, 5.25, np.nan]),
+        "Volume": np.array([300, 100, 500, 200, 400]),
+    }, {"PER": "{:.1f}"})
+    return model
+
+
+def column(model, col):
+    return [model.data(model.index(row, col)) for row in range(model.rowCount())]
+
+
+def test_sort_keeps_missing_last(model):
+    model.sort(3, Qt.AscendingOrder)
+    assert column(model, 3) == ["5.2", "12.5", "45.0", "", ""]
+    model.sort(3, Qt.DescendingOrder)
+    assert column(model, 3) == ["45.0", "12.5", "5.2", "", ""]
+
+    model.sort(0, Qt.AscendingOrder)
+    assert column(model, 0) == ["2024-01-31", "2024-01-31", "2024-02-29", "2024-03-31", ""]
+    model.sort(0, Qt.DescendingOrder)
+    assert column(model, 0) == ["2024-03-31", "2024-02-29", "2024-01-31", "2024-01-31", ""]
+
+    model.sort(2, Qt.AscendingOrder)
+    assert column(model, 2) == ["Kakao", "LG화학", "삼성전자", "", ""]
+    model.sort(2, Qt.DescendingOrder)
+    assert column(model, 2) == ["삼성전자", "LG화학", "Kakao", "", ""]
+
+    model.sort(4, Qt.DescendingOrder)
+    assert column(model, 4) == ["500", "400", "300", "200", "100"]
+
+
+def test_filter_is_case_insensitive_over_string_columns(model):
+    model.set_filter("  kAkAo ")
+    assert column(model, 1) == ["035720"]
+
+    model.set_filter("0006")
+    assert column(model, 1) == ["000660"]
+
+    # 숫자 컬럼과 결측 종목명("nan", "none")은 검색 대상이 아님
+    model.set_filter("45")
+    assert model.rowCount() == 0
+    model.set_filter("nan")
+    assert model.rowCount() == 0
+    model.set_filter("none")
+    assert model.rowCount() == 0
+
+    model.set_filter("")
+    assert model.rowCount() == 5
+
+
+def test_set_columns_keeps_sort_and_filter(model):
+    model.sort(3, Qt.DescendingOrder)
+    model.set_filter("00")
+    model.set_columns({
+        "Date": np.array(["2024-04-30", "2024-04-30", "2024-04-30", "2024-04-30"], dtype="datetime64[ns]"),
+        "Ticker": np.array(["000100", "000200", "000300", "999999"], dtype=object),
+        "Name": np.array(["A", "B", "C", "D"], dtype=object),
+        "PER": np.array([1.0, np.nan, 3.0, 9.0]),
+    })
+
+    # 새 데이터에도 기존 정렬(PER 내림차순)과 필터("00")가 적용됨
+    assert column(model, 1) == ["000300", "000100", "000200"]
+    assert column(model, 3) == ["3.00", "1.00", ""]
+
+
+def test_missing_object_values_render_blank(model):
+    assert column(model, 2) == ["삼성전자", "", "Kakao", "", "LG화학"]
+    assert model.data(model.index(0, 3), Qt.TextAlignmentRole) == int(Qt.AlignRight | Qt.AlignVCenter)
+    assert model.data(model.index(0, 2), Qt.TextAlignmentRole) is None
+
+
+def test_error_view(model):
+    model.sort(3, Qt.DescendingOrder)
+    model.set_columns({"Error": ["No data found for the selected date range."]})
+
+    assert model.rowCount() == 1 and model.columnCount() == 1
+    assert model.headerData(0, Qt.Horizontal) == "Error"
+    assert column(model, 0) == ["No data found for the selected date range."]